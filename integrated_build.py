@@ -12,26 +12,327 @@ import shutil
 import subprocess
 import tempfile
 import platform
-import urllib.request
-import tarfile
-import zipfile
 import json
+import hashlib
+import mmap
+import importlib.util
 from pathlib import Path
 from datetime import datetime
 import argparse
 import time
+import threading
+import functools
+import signal
+import string
+from collections import deque
+from dataclasses import dataclass, fields
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# Buffer size for streaming archive/download copies
+_COPY_BUFSIZE = 128 * 1024
+
+# Source size above which the C build enables parallel LTO
+_LTO_MIN_SOURCE_SIZE = 256 * 1024
+
+# Package size above which the archive is compressed with pigz; smaller trees gain nothing
+_PIGZ_MIN_BYTES = 1024 * 1024
+
+# Size of the first ranged request of a download, which also reveals the total size
+_FIRST_RANGE_BYTES = 4 * 1024 * 1024
+
+# platform.machine() spellings mapped to the names used in artifact paths
+_ARCH_MAP = {
+    'x86_64': 'x64', 'amd64': 'x64', 'x64': 'x64',
+    'i386': 'x32', 'i686': 'x32', 'x86': 'x32',
+    'arm64': 'arm64', 'aarch64': 'arm64',
+    'armv7l': 'arm32', 'arm': 'arm32'
+}
+
+# Per-thread scratch buffer for the userspace copy fallback
+_copy_buffers = threading.local()
+
+
+def _fast_copy(src, dst):
+    """Copy file contents using the cheapest mechanism the OS offers"""
+    if sys.platform == "win32":
+        import ctypes
+        if not ctypes.windll.kernel32.CopyFileExW(str(src), str(dst), None, None, None, 0):
+            raise ctypes.WinError()
+        return
+    
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(infd).st_size
+        
+        # In-kernel copies: copy_file_range (Linux), then sendfile for whatever it left
+        copied = 0
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while copied < size:
+                    n = os.copy_file_range(infd, outfd, size - copied, copied, copied)
+                    if n == 0:
+                        break
+                    copied += n
+            except OSError:
+                pass  # ENOSYS/EXDEV/EINVAL on older kernels and some filesystems
+        if copied < size and hasattr(os, 'sendfile'):
+            try:
+                os.lseek(outfd, copied, os.SEEK_SET)
+                while copied < size:
+                    n = os.sendfile(outfd, infd, copied, size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+            except OSError:
+                pass
+        if copied >= size:
+            return
+        
+        fsrc.seek(0)
+        fdst.seek(0)
+        fdst.truncate()
+        buf = getattr(_copy_buffers, 'buf', None)
+        if buf is None:
+            buf = _copy_buffers.buf = bytearray(1 << 20)
+        view = memoryview(buf)
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            fdst.write(view[:n])
+
+
+def _fast_copy2(src, dst):
+    """_fast_copy plus metadata, as a drop-in for shutil.copy2"""
+    _fast_copy(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _link_or_copy(src, dst):
+    """Hardlink src into a scratch location, copying across filesystems"""
+    dst = Path(dst)
+    # A leftover dst may be a link to src itself; copying into it would truncate the source
+    dst.unlink(missing_ok=True)
+    if os.stat(src).st_dev == os.stat(dst.parent).st_dev:
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            pass
+    _fast_copy(src, dst)
+    return dst
+
+
+def _parse_content_range(header):
+    """(last byte, total size) from a 'bytes first-last/total' header, or (None, None)"""
+    unit, _, spec = header.partition(' ')
+    byte_range, _, total = spec.partition('/')
+    last = byte_range.partition('-')[2]
+    if unit != 'bytes' or not (last.isdigit() and total.isdigit()):
+        return None, None
+    return int(last), int(total)
+
+
+def _parse_shasums(text):
+    """{file name: digest} from sha256sum-style lines, skipping anything else"""
+    sums = {}
+    for line in text.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and len(parts[0]) == 64 and all(c in string.hexdigits for c in parts[0]):
+            sums[parts[1]] = parts[0].lower()
+    return sums
+
+
+def _sha256_file(path):
+    """SHA-256 hex digest of a file, hashed in a single C-level call"""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        h = hashlib.sha256()
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _read_runner_source():
+    """Contents of portable_unified_runner.py, read once per process"""
+    return Path("portable_unified_runner.py").read_bytes()
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name):
+    """shutil.which, walking PATH once per tool per process"""
+    return shutil.which(name)
+
+
+# PyInstaller spec for the unified runner, parsed once at import
+_UNIFIED_SPEC_TEMPLATE = string.Template('''# -*- mode: python ; coding: utf-8 -*-
+
+import sys
+from pathlib import Path
+
+block_cipher = None
+
+# Shared by both Analyses so neither import scan recurses into them
+excludes = ['tkinter', 'matplotlib', 'numpy', 'scipy', 'pandas']
+
+# Collect all built artifacts
+datas = []
+
+# Add source files
+source_files = ['vmtest.c', 'vmtest.py', 'vmtest.js', 'vmtest.rb']
+for src in source_files:
+    src_path = Path($source_dir) / src
+    if src_path.exists():
+        datas.append((str(src_path), '.'))
+
+# Add built executables
+artifacts = $artifacts
+for name, path in artifacts.items():
+    if Path(path).exists():
+        # Get the filename for the destination
+        dest_name = Path(path).name
+        datas.append((str(path), '.'))
+
+a = Analysis(
+    [$runner_script],
+    pathex=[$source_dir],
+    binaries=[],
+    datas=datas,
+    hiddenimports=[
+        'json', 'os', 'sys', 'time', 'subprocess', 'platform', 
+        'shutil', 'tempfile', 'datetime', 'pathlib', 'argparse'
+    ],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=excludes,
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    cipher=block_cipher,
+    noarchive=False,
+    optimize=2,
+)
+
+
+def make_exe(analysis, name):
+    pyz = PYZ(analysis.pure, analysis.zipped_data, cipher=block_cipher)
+    return EXE(
+        pyz,
+        analysis.scripts,
+        [],
+        exclude_binaries=True,
+        name=name,
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=False,
+        console=True,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+        # Executables and their dependencies sit side by side in the bundle dir
+        contents_directory='.',
+    )
+
+
+collect_args = [make_exe(a, 'vmtest_portable'), a.binaries, a.zipfiles, a.datas]
+
+# The Python implementation is frozen in the same run, sharing the runner's libraries
+python_script = $python_script
+if python_script:
+    a_python = Analysis(
+        [python_script],
+        pathex=[$source_dir],
+        binaries=[],
+        datas=[],
+        hiddenimports=[],
+        hookspath=[],
+        hooksconfig={},
+        runtime_hooks=[],
+        excludes=excludes,
+        cipher=block_cipher,
+        noarchive=False,
+        optimize=2,
+    )
+    collect_args += [make_exe(a_python, 'vmtest_python'), a_python.binaries, a_python.zipfiles, a_python.datas]
+
+coll = COLLECT(
+    *collect_args,
+    strip=False,
+    upx=False,
+    name='vmtest_portable',
+)
+''')
+
+# Ruby launchers, encoded once with the platform's line endings
+_WIN_RUBY_WRAPPER = """@echo off
+if not exist ruby.exe (
+    echo Ruby not found. Please install Ruby.
+    exit /b 1
+)
+ruby "%~dp0vmtest.rb" %*
+""".replace("\n", os.linesep).encode('utf-8')
+
+_UNIX_RUBY_WRAPPER = """#!/bin/bash
+if ! command -v ruby >/dev/null 2>&1; then
+    echo "Ruby not found. Please install Ruby."
+    exit 1
+fi
+exec ruby "$(dirname "$0")/vmtest.rb" "$@"
+""".replace("\n", os.linesep).encode('utf-8')
+
+@dataclass
+class BuildArtifacts:
+    """Paths of the per-language builds that made it into this run"""
+    c: Optional[Path] = None
+    python: Optional[Path] = None
+    nodejs: Optional[Path] = None
+    ruby: Optional[Path] = None
+
+    def items(self):
+        """(name, path) pairs for the artifacts that were built"""
+        return [(f.name, getattr(self, f.name)) for f in fields(self) if getattr(self, f.name) is not None]
+
+    def names(self):
+        return [name for name, _ in self.items()]
+
+    def as_strings(self):
+        """Built artifacts as {name: str(path)}, for embedding in the spec"""
+        return {name: str(path) for name, path in self.items()}
+
+    def __bool__(self):
+        return any(getattr(self, f.name) is not None for f in fields(self))
+
 
 class IntegratedPortableBuilder:
-    def __init__(self, output_dir="vmtest_complete_portable"):
+    def __init__(self, output_dir="vmtest_complete_portable", verbose=False, auto_install=False):
         self.output_dir = Path(output_dir)
+        self.verbose = verbose
+        self.auto_install = auto_install
         self.temp_dir = Path(tempfile.mkdtemp(prefix="vmtest_integrated_build_"))
         self.platform = platform.system().lower()
         self.arch = self._normalize_arch(platform.machine().lower())
+        self.is_windows = self.platform == "windows"
+        self.is_darwin = self.platform == "darwin"
+        self.is_linux = self.platform == "linux"
+        self._exe_suffix = ".exe" if self.is_windows else ""
         
         # Configuration
         self.node_version = "18.17.0"
-        self.build_artifacts = {}
+        self.cache_dir = Path.home() / ".cache" / "vmtest_builder"
+        self.build_artifacts = BuildArtifacts()
+        self._artifacts_lock = threading.Lock()
+        # Phase 1 builds log from several threads; keep their lines whole
+        self._log_lock = threading.Lock()
         self.build_start_time = time.time()
+        self._now_str = datetime.fromtimestamp(self.build_start_time).strftime('%Y-%m-%d %H:%M:%S')
         
         print(f"🏗️  VMtest Integrated Portable Builder")
         print(f"Platform: {self.platform}-{self.arch}")
@@ -40,47 +341,111 @@ class IntegratedPortableBuilder:
 
     def _normalize_arch(self, arch):
         """Normalize architecture names"""
-        arch_map = {
-            'x86_64': 'x64', 'amd64': 'x64', 'x64': 'x64',
-            'i386': 'x32', 'i686': 'x32', 'x86': 'x32',
-            'arm64': 'arm64', 'aarch64': 'arm64',
-            'armv7l': 'arm32', 'arm': 'arm32'
-        }
-        return arch_map.get(arch, arch)
+        return _ARCH_MAP.get(arch, arch)
 
     def log(self, message, level="INFO"):
         """Log with timestamp"""
         timestamp = datetime.now().strftime('%H:%M:%S')
-        print(f"[{timestamp}] {message}")
+        line = f"[{timestamp}] {message}\n"
+        with self._log_lock:
+            sys.stdout.write(line)
 
-    def run_command(self, cmd, cwd=None):
-        """Run command and return success"""
+    async def run_command_async(self, cmd, cwd=None, timeout=300):
+        """Run command, streaming its output, and return success"""
+        import asyncio
+        if isinstance(cmd, str):
+            cmd = cmd.split()
+        
+        # Keep only the tail of the output for error diagnostics
+        tail = deque(maxlen=200)
+        
+        def emit(line):
+            text = line.decode(errors='replace').rstrip()
+            tail.append(text)
+            if self.verbose:
+                self.log(f"  {text}")
+        
+        async def drain(stream):
+            # Read blocks, not lines: a long line must not trip the StreamReader line limit
+            pending = bytearray()
+            while True:
+                chunk = await stream.read(_COPY_BUFSIZE)
+                if not chunk:
+                    break
+                end = chunk.rfind(b'\n')
+                if end < 0:
+                    pending += chunk
+                    continue
+                pending += chunk[:end]
+                for line in pending.split(b'\n'):
+                    emit(line)
+                pending = bytearray(chunk[end + 1:])
+            if pending:
+                emit(pending)
+        
+        # Own process group, so a timeout can take down compilers' and pip's children too
+        if self.is_windows:
+            group_kwargs = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            group_kwargs = {'start_new_session': True}
+        
         try:
-            if isinstance(cmd, str):
-                cmd = cmd.split()
-            
-            result = subprocess.run(
-                cmd, 
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
                 cwd=cwd or self.temp_dir,
-                capture_output=True, 
-                text=True, 
-                timeout=300
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                **group_kwargs
             )
-            
-            if result.returncode == 0:
-                return True
-            else:
-                self.log(f"Command failed: {' '.join(cmd)}", "ERROR")
-                if result.stderr:
-                    self.log(f"Error: {result.stderr}", "ERROR")
-                return False
-                
-        except subprocess.TimeoutExpired:
+        except Exception as e:
+            self.log(f"Command error: {e}", "ERROR")
+            return False
+        
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(drain(proc.stdout), drain(proc.stderr), proc.wait()),
+                timeout
+            )
+        except asyncio.TimeoutError:
             self.log(f"Command timed out: {' '.join(cmd)}", "ERROR")
             return False
         except Exception as e:
             self.log(f"Command error: {e}", "ERROR")
             return False
+        finally:
+            # Never leave a running or unreaped child behind
+            if proc.returncode is None:
+                self._kill_process_tree(proc)
+                await proc.wait()
+        
+        if proc.returncode == 0:
+            return True
+        
+        self.log(f"Command failed: {' '.join(cmd)}", "ERROR")
+        if tail:
+            self.log("Error: " + "\n".join(tail), "ERROR")
+        return False
+
+    def _kill_process_tree(self, proc):
+        """Kill a command started by run_command_async along with everything it spawned"""
+        try:
+            if self.is_windows:
+                subprocess.run(["taskkill", "/T", "/F", "/PID", str(proc.pid)],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            else:
+                os.killpg(proc.pid, signal.SIGKILL)
+        except OSError:
+            pass
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+
+    def run_command(self, cmd, cwd=None):
+        """Run command and return success"""
+        import asyncio
+        return asyncio.run(self.run_command_async(cmd, cwd))
 
     def build_c_executable(self):
         """Build C executable"""
@@ -91,16 +456,44 @@ class IntegratedPortableBuilder:
             return None
         
         # Copy source
-        shutil.copy2("vmtest.c", self.temp_dir / "vmtest.c")
+        _link_or_copy("vmtest.c", self.temp_dir / "vmtest.c")
         
         # Compile
-        output_name = "vmtest" + (".exe" if self.platform == "windows" else "")
-        compile_args = ["gcc", "-static", "-O2", "vmtest.c", "-o", output_name, "-lpthread", "-lm"]
+        output_name = "vmtest" + self._exe_suffix
+        compile_args = ["gcc", "-static", "-O2", "-pipe", "vmtest.c", "-o", output_name, "-lpthread", "-lm"]
         
-        if self.platform == "linux":
+        if self.is_linux:
             compile_args.append("-lrt")
         
+        # Strip at link time and drop unreferenced sections, so the bundled
+        # binary (and the archive that compresses it) carries no dead weight
+        compile_args.append("-s")
+        if self.is_linux:
+            compile_args.extend(["-ffunction-sections", "-fdata-sections", "-Wl,--gc-sections"])
+        
+        # Prefer a faster linker when one is installed and this gcc can drive it
+        for linker in ("mold", "lld"):
+            if _which(f"ld.{linker}") and self._gcc_accepts_linker(linker):
+                compile_args.append(f"-fuse-ld={linker}")
+                break
+        
+        # Parallel LTO only pays off once the translation unit is big enough
+        if os.path.getsize("vmtest.c") >= _LTO_MIN_SOURCE_SIZE:
+            compile_args.extend(["-flto=auto", "-fno-fat-lto-objects"])
+        
+        # An unchanged source, flag set and toolchain yield the same binary
+        executable_path = self.temp_dir / output_name
+        cache_key = self._c_cache_key(compile_args)
+        if cache_key and self._restore_cached_build(cache_key, executable_path, "c"):
+            with self._artifacts_lock:
+                self.build_artifacts.c = executable_path
+            self.log(f"✅ C executable (cached): {executable_path}")
+            return executable_path
+        
         result = self.run_command(compile_args)
+        # Only the static build matches the cache key; a dynamic fallback is
+        # rebuilt each time so static linking is retried once it can succeed
+        cacheable = bool(result and cache_key)
         if not result:
             # Try without static linking
             self.log("Trying compilation without static linking...")
@@ -108,73 +501,156 @@ class IntegratedPortableBuilder:
             result = self.run_command(compile_args)
         
         if result:
-            executable_path = self.temp_dir / output_name
             if executable_path.exists():
-                self.build_artifacts['c'] = executable_path
+                if cacheable:
+                    self._store_cached_build(cache_key, executable_path, "c")
+                with self._artifacts_lock:
+                    self.build_artifacts.c = executable_path
                 self.log(f"✅ C executable: {executable_path}")
                 return executable_path
         
         self.log("❌ C build failed")
         return None
 
+    def _gcc_accepts_linker(self, linker):
+        """Whether gcc takes -fuse-ld=linker (older gcc rejects mold) and finds the linker"""
+        try:
+            result = subprocess.run(["gcc", f"-fuse-ld={linker}", "-Wl,--version"],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return result.returncode == 0
+
+    def _c_cache_key(self, compile_args):
+        """Hash of the C source, compile flags and toolchain, or None if gcc can't be queried"""
+        try:
+            toolchain = subprocess.run(["gcc", "--version"], capture_output=True, check=True).stdout
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        
+        h = hashlib.sha256(toolchain)
+        # Static builds embed libc, so its version is part of the output too
+        h.update("\0".join([*compile_args, *platform.libc_ver(), _sha256_file("vmtest.c")]).encode())
+        return h.hexdigest()
+
     def build_python_executable(self):
-        """Build Python executable with PyInstaller"""
-        self.log("🐍 Building Python executable...")
+        """Prepare the Python implementation for the unified PyInstaller build"""
+        self.log("🐍 Preparing Python executable...")
         
         if not Path("vmtest.py").exists():
             self.log("⚠️  vmtest.py not found - skipping Python build")
             return None
         
         # Install PyInstaller if needed
-        try:
-            subprocess.run([sys.executable, "-c", "import PyInstaller"], 
-                         capture_output=True, check=True)
-        except:
+        if importlib.util.find_spec("PyInstaller") is None:
+            if not self.auto_install:
+                self.log("❌ PyInstaller not found (install it or pass --auto-install)")
+                return None
             self.log("📦 Installing PyInstaller...")
+            # Non-interactive, no self-update check, and wheels over source builds
             result = self.run_command([
-                sys.executable, "-m", "pip", "install", "pyinstaller"
+                sys.executable, "-m", "pip", "install", "--no-input",
+                "--disable-pip-version-check", "--no-warn-script-location",
+                "--prefer-binary", "pyinstaller"
             ])
             if not result:
                 self.log("❌ Failed to install PyInstaller")
                 return None
         
-        # Copy source
-        shutil.copy2("vmtest.py", self.temp_dir / "vmtest.py")
-        
-        # Build
-        exe_name = "vmtest_python" + (".exe" if self.platform == "windows" else "")
-        
-        build_args = [
-            "pyinstaller",
-            "--onefile",
-            "--clean",
-            "--noconfirm",
-            "--name", exe_name.replace('.exe', ''),
-            "--distpath", str(self.temp_dir),
-            "vmtest.py"
-        ]
-        
-        result = self.run_command(build_args)
-        if result:
-            exe_path = self.temp_dir / exe_name
-            if exe_path.exists():
-                self.build_artifacts['python'] = exe_path
-                self.log(f"✅ Python executable ready")
-                return exe_path
+        # Copy source; the executable itself is frozen alongside the unified
+        # runner so both share a single PyInstaller run and _internal directory
+        script_path = _link_or_copy("vmtest.py", self.temp_dir / "vmtest.py")
+        with self._artifacts_lock:
+            self.build_artifacts.python = script_path
+        self.log(f"✅ Python sources staged for the unified build")
+        return script_path
+
+    def _run_pyinstaller(self, args):
+        """Run PyInstaller in-process, reusing modules loaded by earlier builds"""
+        # Keep PyInstaller's intermediate files on tmpfs when there is one
+        shm = Path("/dev/shm")
+        workpath = Path(tempfile.mkdtemp(prefix="vmtest_pyi_",
+                                         dir=shm if shm.is_dir() and os.access(shm, os.W_OK) else self.temp_dir))
+        saved_argv = sys.argv[:]
+        try:
+            importlib.invalidate_caches()
+            from PyInstaller.__main__ import run as pyi_run
+            pyi_run(["--workpath", str(workpath), *args])
+            return True
+        except SystemExit as e:
+            if e.code in (None, 0):
+                return True
+            self.log(f"PyInstaller exited with status {e.code}", "ERROR")
+            return False
+        except Exception as e:
+            self.log(f"PyInstaller error: {e}", "ERROR")
+            return False
+        finally:
+            sys.argv = saved_argv
+            shutil.rmtree(workpath, ignore_errors=True)
+
+    def _pyinstaller_cache_key(self, inputs, variant):
+        """Content hash of everything that feeds into a PyInstaller build"""
+        import importlib.metadata
+        try:
+            pyinstaller_version = importlib.metadata.version("pyinstaller")
+        except importlib.metadata.PackageNotFoundError:
+            pyinstaller_version = "unknown"
         
-        self.log("❌ Python build failed")
-        return None
+        h = hashlib.sha256()
+        h.update(f"{variant}\0{sys.version}\0{pyinstaller_version}\0".encode())
+        # The builder itself carries the spec template and build flags
+        entries = []
+        for path in [Path(__file__), *map(Path, inputs)]:
+            files = sorted(p for p in path.rglob('*') if p.is_file()) if path.is_dir() else [path]
+            entries.extend((file.relative_to(path.parent), file) for file in files)
+        
+        # hashlib releases the GIL on large buffers, so hash the files side by side
+        with ThreadPoolExecutor(max_workers=min(len(entries), os.cpu_count() or 1)) as ex:
+            digests = ex.map(_sha256_file, [file for _, file in entries])
+            for (name, _), digest in zip(entries, digests):
+                h.update(f"{name}\0{digest}\0".encode())
+        return h.hexdigest()
+
+    def _restore_cached_build(self, cache_key, dest, kind="pyinstaller"):
+        """Copy a previously cached build output to dest, if present"""
+        cached = self.cache_dir / kind / cache_key / Path(dest).name
+        if not cached.exists():
+            return False
+        
+        self.log(f"Using cached build: {cached}")
+        if cached.is_dir():
+            shutil.copytree(cached, dest, symlinks=True, copy_function=_fast_copy2)
+        else:
+            _fast_copy2(cached, dest)
+        return True
+
+    def _store_cached_build(self, cache_key, src, kind="pyinstaller"):
+        """Save a build output in the build cache"""
+        cached = self.cache_dir / kind / cache_key / Path(src).name
+        if cached.exists():
+            return
+        
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            staging = cached.with_name(cached.name + ".part")
+            if Path(src).is_dir():
+                shutil.rmtree(staging, ignore_errors=True)
+                shutil.copytree(src, staging, symlinks=True, copy_function=_fast_copy2)
+            else:
+                _fast_copy2(src, staging)
+            os.replace(staging, cached)
+        except OSError as e:
+            self.log(f"⚠️  Could not cache {kind} build: {e}")
 
     def download_nodejs(self):
         """Download portable Node.js"""
         self.log("📦 Getting portable Node.js...")
         
         version = self.node_version
-        node_dir = self.temp_dir / "nodejs"
-        node_dir.mkdir(exist_ok=True)
         
         # Determine download URL
-        if self.platform == "windows":
+        if self.is_windows:
             if self.arch == "x64":
                 url = f"https://nodejs.org/dist/v{version}/node-v{version}-win-x64.zip"
                 archive_name = f"node-v{version}-win-x64.zip"
@@ -183,7 +659,7 @@ class IntegratedPortableBuilder:
                 url = f"https://nodejs.org/dist/v{version}/node-v{version}-win-x86.zip"
                 archive_name = f"node-v{version}-win-x86.zip"
                 binary_path = f"node-v{version}-win-x86/node.exe"
-        elif self.platform == "darwin":
+        elif self.is_darwin:
             url = f"https://nodejs.org/dist/v{version}/node-v{version}-darwin-x64.tar.gz"
             archive_name = f"node-v{version}-darwin-x64.tar.gz"
             binary_path = f"node-v{version}-darwin-x64/bin/node"
@@ -198,44 +674,249 @@ class IntegratedPortableBuilder:
                 binary_path = f"node-v{version}-linux-x86/bin/node"
         
         try:
-            self.log(f"Downloading from: {url}")
-            archive_path = node_dir / archive_name
-            urllib.request.urlretrieve(url, archive_path)
-            
-            # Extract archive
-            if archive_name.endswith('.zip'):
-                with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                    zip_ref.extractall(node_dir)
-            elif archive_name.endswith('.tar.gz'):
-                with tarfile.open(archive_path, 'r:gz') as tar_ref:
-                    tar_ref.extractall(node_dir)
-            elif archive_name.endswith('.tar.xz'):
-                with tarfile.open(archive_path, 'r:xz') as tar_ref:
-                    tar_ref.extractall(node_dir)
+            expected = self._node_archive_digest(archive_name)
+            dest_binary = self.temp_dir / ("node" + self._exe_suffix)
             
-            # Copy binary to temp directory
-            source_binary = node_dir / binary_path
-            dest_binary = self.temp_dir / ("node.exe" if self.platform == "windows" else "node")
+            # Only the node binary is needed, so pull that single member out
+            # of the archive instead of expanding the whole distribution
+            if expected is None and not archive_name.endswith('.zip'):
+                # Nothing to verify or cache, so decompress straight off the wire
+                self.log("⚠️  Downloading Node.js without checksum verification")
+                self.log(f"Streaming from: {url}")
+                import urllib.request
+                with urllib.request.urlopen(url, timeout=60) as response:
+                    found = self._extract_node_binary(response, archive_name, binary_path, dest_binary)
+            else:
+                archive_path = self._fetch_node_archive(url, archive_name, expected)
+                found = self._extract_node_binary(archive_path, archive_name, binary_path, dest_binary)
             
-            if source_binary.exists():
-                shutil.copy2(source_binary, dest_binary)
+            if found:
                 os.chmod(dest_binary, 0o755)
                 
                 # Also copy vmtest.js if it exists
                 if Path("vmtest.js").exists():
-                    shutil.copy2("vmtest.js", self.temp_dir / "vmtest.js")
+                    _link_or_copy("vmtest.js", self.temp_dir / "vmtest.js")
                 
-                self.build_artifacts['nodejs'] = dest_binary
+                with self._artifacts_lock:
+                    self.build_artifacts.nodejs = dest_binary
                 self.log(f"✅ Node.js ready: {dest_binary}")
                 return dest_binary
             else:
-                self.log(f"Node.js binary not found at: {source_binary}")
+                self.log(f"Node.js binary not found in archive: {binary_path}")
                 return None
                 
         except Exception as e:
             self.log(f"Node.js download failed: {e}")
             return None
 
+    def _fetch_node_shasums(self, archive_name):
+        """Fetch the published SHA-256 digests for the configured Node.js release"""
+        # A release's SHASUMS file never changes, so one fetch per version is enough
+        cache_path = self.cache_dir / "nodejs" / f"v{self.node_version}-SHASUMS256.txt"
+        if cache_path.exists():
+            sums = _parse_shasums(cache_path.read_text(encoding='utf-8', errors='replace'))
+            if archive_name in sums:
+                return sums
+        
+        url = f"https://nodejs.org/dist/v{self.node_version}/SHASUMS256.txt"
+        import urllib.request
+        with urllib.request.urlopen(url, timeout=30) as response:
+            text = response.read().decode('utf-8', errors='replace')
+        sums = _parse_shasums(text)
+        
+        # Anything else that answered 200 (e.g. a captive portal page) must not be kept
+        if archive_name in sums:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                part_path = cache_path.with_name(cache_path.name + ".part")
+                part_path.write_text(text, encoding='utf-8')
+                os.replace(part_path, cache_path)
+            except OSError as e:
+                self.log(f"⚠️  Could not cache Node.js checksums: {e}")
+        return sums
+
+    def _node_archive_digest(self, archive_name):
+        """Published SHA-256 of a Node.js archive, or None if it can't be fetched"""
+        try:
+            return self._fetch_node_shasums(archive_name).get(archive_name)
+        except Exception as e:
+            self.log(f"⚠️  Could not fetch Node.js checksums: {e}")
+            return None
+
+    def _fetch_node_archive(self, url, archive_name, expected):
+        """Return a local copy of a Node.js archive, checksum-verified when expected is known"""
+        if not expected:
+            # Nothing to verify against, so don't let it into the cache
+            self.log("⚠️  Downloading Node.js without checksum verification")
+            self.log(f"Downloading from: {url}")
+            node_dir = self.temp_dir / "nodejs"
+            node_dir.mkdir(exist_ok=True)
+            archive_path = node_dir / archive_name
+            self._download_file(url, archive_path)
+            return archive_path
+        
+        # Cache entries are keyed by digest and only renamed into place once
+        # verified, so an existing entry can be trusted without re-hashing
+        cache_path = self.cache_dir / expected / archive_name
+        if cache_path.exists():
+            self.log(f"Using cached Node.js archive: {cache_path}")
+            return cache_path
+        
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = cache_path.with_name(cache_path.name + ".part")
+        self.log(f"Downloading from: {url}")
+        self._download_file(url, part_path)
+        
+        digest = _sha256_file(part_path)
+        if digest != expected:
+            part_path.unlink()
+            raise ValueError(f"checksum mismatch for {archive_name}: got {digest}, expected {expected}")
+        
+        os.replace(part_path, cache_path)
+        return cache_path
+
+    def _download_file(self, url, dest, nthreads=4):
+        """Download url to dest, splitting into parallel range requests when supported"""
+        import urllib.request
+        if not hasattr(os, 'pwrite'):
+            self._download_whole(url, dest)
+            return
+        
+        # The first range request doubles as the size probe, saving a separate HEAD round trip
+        request = urllib.request.Request(url, headers={'Range': f'bytes=0-{_FIRST_RANGE_BYTES - 1}'})
+        with urllib.request.urlopen(request, timeout=60) as response:
+            first_end, size = _parse_content_range(response.headers.get('Content-Range', ''))
+            if response.status != 206:
+                # Range ignored: this response already carries the whole file
+                with open(dest, 'wb') as f:
+                    shutil.copyfileobj(response, f, _COPY_BUFSIZE)
+                return
+            if size is None:
+                # Partial content of unknown total size ('bytes 0-N/*'): fetch it in one piece
+                response.close()
+                self._download_whole(url, dest)
+                return
+            
+            fd = os.open(dest, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.ftruncate(fd, size)
+                rest = size - first_end - 1
+                chunk = -(-rest // nthreads) if rest > 0 else 1
+                with ThreadPoolExecutor(max_workers=nthreads) as ex:
+                    futures = [
+                        ex.submit(self._download_range, url, fd, start, min(start + chunk, size) - 1)
+                        for start in range(first_end + 1, size, chunk)
+                    ]
+                    # Drain the probe response while the remaining ranges download
+                    self._write_range(response, fd, 0, first_end)
+                    for future in futures:
+                        future.result()
+            finally:
+                os.close(fd)
+
+    def _download_whole(self, url, dest):
+        """Download url to dest in a single request"""
+        import urllib.request
+        with urllib.request.urlopen(url, timeout=60) as response, open(dest, 'wb') as f:
+            shutil.copyfileobj(response, f, _COPY_BUFSIZE)
+
+    def _download_range(self, url, fd, start, end):
+        """Fetch bytes [start, end] of url and write them at the same offset in fd"""
+        import urllib.request
+        request = urllib.request.Request(url, headers={'Range': f'bytes={start}-{end}'})
+        with urllib.request.urlopen(request, timeout=60) as response:
+            if response.status != 206:
+                raise OSError(f"server ignored range request ({response.status})")
+            self._write_range(response, fd, start, end)
+
+    def _write_range(self, response, fd, start, end):
+        """Copy a ranged response body into fd at [start, end]"""
+        offset = start
+        while True:
+            data = response.read(_COPY_BUFSIZE)
+            if not data:
+                break
+            os.pwrite(fd, data, offset)
+            offset += len(data)
+        
+        if offset != end + 1:
+            raise OSError(f"short read for bytes {start}-{end}")
+
+    def _extract_node_binary(self, source, archive_name, member_name, dest):
+        """Extract the node binary from an archive path, or from a stream for tarballs"""
+        if archive_name.endswith('.zip'):
+            import zipfile
+            with zipfile.ZipFile(source, 'r') as zip_ref:
+                if member_name not in zip_ref.namelist():
+                    return False
+                with zip_ref.open(member_name) as src, open(dest, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+            return True
+        
+        # External decompressors run in their own process, overlapping with tar parsing
+        if archive_name.endswith('.tar.xz') and _which('xz'):
+            return self._extract_piped_member(["xz", "-dc", "-T0"], source, member_name, dest)
+        if archive_name.endswith('.tar.gz') and _which('pigz'):
+            return self._extract_piped_member(["pigz", "-dc"], source, member_name, dest)
+        
+        import tarfile
+        mode = 'r|gz' if archive_name.endswith('.tar.gz') else 'r|xz'
+        if not isinstance(source, (str, Path)):
+            with tarfile.open(fileobj=source, mode=mode) as tar_ref:
+                return self._extract_tar_member(tar_ref, member_name, dest)
+        
+        with open(source, 'rb') as f:
+            if hasattr(os, 'posix_fadvise'):
+                # Let kernel readahead overlap with decompression
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            with tarfile.open(fileobj=f, mode=mode) as tar_ref:
+                return self._extract_tar_member(tar_ref, member_name, dest)
+
+    def _extract_tar_member(self, tar_ref, member_name, dest):
+        """Stream a single regular file out of a tar archive"""
+        for member in tar_ref:
+            if member.name == member_name and member.isfile():
+                with tar_ref.extractfile(member) as src, open(dest, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+                return True
+        return False
+
+    def _extract_piped_member(self, decompress_cmd, source, member_name, dest):
+        """Stream a tar member out of an archive (path or stream) decompressed by an external tool"""
+        import tarfile
+        if isinstance(source, (str, Path)):
+            proc = subprocess.Popen([*decompress_cmd, str(source)],
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            feeder = None
+        else:
+            proc = subprocess.Popen(decompress_cmd, stdin=subprocess.PIPE,
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            
+            def feed():
+                try:
+                    shutil.copyfileobj(source, proc.stdin, _COPY_BUFSIZE)
+                except OSError:
+                    pass  # the decompressor exited once we stopped reading
+                finally:
+                    try:
+                        proc.stdin.close()
+                    except OSError:
+                        pass
+            
+            feeder = threading.Thread(target=feed, daemon=True)
+            feeder.start()
+        try:
+            with tarfile.open(fileobj=proc.stdout, mode='r|') as tar_ref:
+                found = self._extract_tar_member(tar_ref, member_name, dest)
+        finally:
+            # The decompressor gets SIGPIPE if we stop reading after the member we wanted
+            proc.stdout.close()
+            proc.wait()
+            if feeder is not None:
+                feeder.join()
+        return found
+
     def create_ruby_wrapper(self):
         """Create Ruby wrapper (since portable Ruby is complex)"""
         self.log("💎 Creating Ruby wrapper...")
@@ -245,36 +926,24 @@ class IntegratedPortableBuilder:
             return None
         
         # Copy Ruby source
-        shutil.copy2("vmtest.rb", self.temp_dir / "vmtest.rb")
+        _link_or_copy("vmtest.rb", self.temp_dir / "vmtest.rb")
         
         # Create wrapper script
-        if self.platform == "windows":
+        if self.is_windows:
             wrapper_name = "vmtest_ruby.bat"
-            wrapper_content = """@echo off
-if not exist ruby.exe (
-    echo Ruby not found. Please install Ruby.
-    exit /b 1
-)
-ruby "%~dp0vmtest.rb" %*
-"""
+            wrapper_content = _WIN_RUBY_WRAPPER
         else:
             wrapper_name = "vmtest_ruby"
-            wrapper_content = """#!/bin/bash
-if ! command -v ruby >/dev/null 2>&1; then
-    echo "Ruby not found. Please install Ruby."
-    exit 1
-fi
-ruby "$(dirname "$0")/vmtest.rb" "$@"
-"""
+            wrapper_content = _UNIX_RUBY_WRAPPER
         
         wrapper_path = self.temp_dir / wrapper_name
-        with open(wrapper_path, 'w') as f:
-            f.write(wrapper_content)
+        wrapper_path.write_bytes(wrapper_content)
         
-        if self.platform != "windows":
+        if not self.is_windows:
             os.chmod(wrapper_path, 0o755)
         
-        self.build_artifacts['ruby'] = wrapper_path
+        with self._artifacts_lock:
+            self.build_artifacts.ruby = wrapper_path
         self.log(f"✅ Ruby wrapper ready")
         return wrapper_path
 
@@ -285,103 +954,49 @@ ruby "$(dirname "$0")/vmtest.rb" "$@"
         # Create the portable unified runner script
         runner_script = self.temp_dir / "portable_unified_runner.py"
         
-        # Read the portable_unified_runner.py content from the artifact we created
-        runner_content = open("portable_unified_runner.py", "r").read()
+        runner_script.write_bytes(_read_runner_source())
         
-        with open(runner_script, 'w') as f:
-            f.write(runner_content)
+        exe_name = "vmtest_portable" + self._exe_suffix
+        dist_dir = self.temp_dir / "dist" / "vmtest_portable"
         
-        # Create PyInstaller spec
-        spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
-
-import sys
-from pathlib import Path
-
-block_cipher = None
-
-# Collect all built artifacts
-datas = []
-
-# Add source files
-source_files = ['vmtest.c', 'vmtest.py', 'vmtest.js', 'vmtest.rb']
-for src in source_files:
-    if Path(src).exists():
-        datas.append((src, '.'))
-
-# Add built executables
-artifacts = {repr(dict((k, str(v)) for k, v in self.build_artifacts.items()))}
-for name, path in artifacts.items():
-    if Path(path).exists():
-        # Get the filename for the destination
-        dest_name = Path(path).name
-        datas.append((str(path), '.'))
-
-a = Analysis(
-    ['{runner_script}'],
-    pathex=['{self.temp_dir}'],
-    binaries=[],
-    datas=datas,
-    hiddenimports=[
-        'json', 'os', 'sys', 'time', 'subprocess', 'platform', 
-        'shutil', 'tempfile', 'datetime', 'pathlib', 'argparse'
-    ],
-    hookspath=[],
-    hooksconfig={{}},
-    runtime_hooks=[],
-    excludes=['tkinter', 'matplotlib', 'numpy', 'scipy', 'pandas'],
-    win_no_prefer_redirects=False,
-    win_private_assemblies=False,
-    cipher=block_cipher,
-    noarchive=False,
-    optimize=2,
-)
-
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
-    name='vmtest_portable',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=True,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-)
-'''
+        # Skip PyInstaller entirely when none of the bundled inputs changed
+        bundled_sources = [self.temp_dir / src for src in ('vmtest.c', 'vmtest.py', 'vmtest.js', 'vmtest.rb')
+                           if (self.temp_dir / src).exists()]
+        cache_inputs = [runner_script, *bundled_sources,
+                        *(path for _, path in self.build_artifacts.items())]
+        cache_key = self._pyinstaller_cache_key(cache_inputs, "unified")
+        dist_dir.parent.mkdir(exist_ok=True)
+        if self._restore_cached_build(cache_key, dist_dir):
+            self.log(f"✅ Unified executable created (cached): {dist_dir / exe_name}")
+            return dist_dir
+        
+        # Create PyInstaller spec; the Python script is frozen, not bundled as data
+        artifact_paths = self.build_artifacts.as_strings()
+        python_script = artifact_paths.pop('python', None)
+        spec_content = _UNIFIED_SPEC_TEMPLATE.substitute(
+            source_dir=repr(str(self.temp_dir)),
+            artifacts=repr(artifact_paths),
+            runner_script=repr(str(runner_script)),
+            python_script=repr(python_script),
+        )
         
         spec_file = self.temp_dir / "vmtest_portable.spec"
-        with open(spec_file, 'w') as f:
-            f.write(spec_content)
+        spec_file.write_text(spec_content)
         
         # Build with PyInstaller
         self.log("Running PyInstaller...")
-        result = self.run_command([
-            'pyinstaller',
+        result = self._run_pyinstaller([
             '--clean',
             '--noconfirm',
+            '--distpath', str(dist_dir.parent),
             str(spec_file)
         ])
         
         if result:
-            # Find the built executable
-            exe_name = "vmtest_portable" + (".exe" if self.platform == "windows" else "")
-            exe_path = self.temp_dir / "dist" / exe_name
-            
-            if exe_path.exists():
-                self.log(f"✅ Unified executable created: {exe_path}")
-                return exe_path
+            if (dist_dir / exe_name).exists():
+                self._store_cached_build(cache_key, dist_dir)
+                self.log(f"✅ Unified executable created: {dist_dir / exe_name}")
+                return dist_dir
             else:
                 self.log("❌ Executable not found after build")
                 return None
@@ -389,131 +1004,128 @@ exe = EXE(
             self.log("❌ PyInstaller build failed")
             return None
 
-    def create_final_package(self, unified_exe):
+    def create_final_package(self, unified_dir):
         """Create final package"""
         self.log("📦 Creating final package...")
         
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Copy the unified executable
-        final_exe_name = "vmtest_portable" + (".exe" if self.platform == "windows" else "")
-        final_exe_path = self.output_dir / final_exe_name
-        shutil.copy2(unified_exe, final_exe_path)
+        # Move the unified executable directory; the temp dir is discarded anyway,
+        # so on the same filesystem this is a rename instead of a full copy
+        final_exe_name = "vmtest_portable" + self._exe_suffix
+        final_dir = self.output_dir / "vmtest_portable"
+        if final_dir.exists():
+            shutil.rmtree(final_dir)
+        shutil.move(str(unified_dir), str(final_dir), copy_function=_fast_copy2)
+        final_exe_path = final_dir / final_exe_name
         
-        if self.platform != "windows":
+        if not self.is_windows:
             os.chmod(final_exe_path, 0o755)
         
-        # Create README
-        readme_content = f"""# VMtest Portable Suite
-
-This is a complete, self-contained VMtest suite that includes:
-
-## What's Inside
-- C implementation (statically compiled)
-- Python implementation (PyInstaller executable)
-- Node.js implementation (embedded runtime + script)
-- Ruby implementation (wrapper script)
-- Unified runner that orchestrates all implementations
-
-## Usage
-
-Simply run the executable:
-
-```bash
-# Basic usage
-./{final_exe_name}
-
-# With custom iterations
-./{final_exe_name} --iterations 2000
-
-# Verbose output
-./{final_exe_name} --verbose
-
-# Custom output directory
-./{final_exe_name} --output ./my_results
-```
-
-## Output
-
-The tool will:
-1. Detect which implementations are available
-2. Run all available implementations
-3. Cross-validate results between languages
-4. Generate comprehensive JSON and text reports
-5. Provide VM detection consensus
-
-## Features
-
-- **Zero Dependencies**: Everything is self-contained
-- **Cross-Platform**: Works on Windows, Linux, and macOS
-- **Multiple Languages**: Tests VM detection across different runtime environments
-- **Portable**: Single executable, no installation required
-- **Comprehensive**: Detailed analysis and reporting
-
-## Built Information
-
-- Build Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-- Platform: {platform.platform()}
-- Included Implementations: {list(self.build_artifacts.keys())}
-
-## Notes
-
-- If Ruby is not installed on the target system, Ruby tests will be skipped
-- All other implementations are fully self-contained
-- Results are saved in JSON format for further analysis
-- The tool automatically handles platform-specific differences
-
-Enjoy your portable VM detection toolkit! 🚀
-"""
+        # Single-file deliverable, compressed once here instead of by UPX
+        archive_base = self.output_dir / f"vmtest_portable-{self.platform}-{self.arch}"
+        archive_path = self._make_archive(archive_base, final_dir)
+        self.log(f"Archive: {archive_path}")
         
-        readme_path = self.output_dir / "README.md"
-        with open(readme_path, 'w') as f:
-            f.write(readme_content)
+        # Static README plus a manifest for the per-build details
+        _fast_copy2(Path(__file__).resolve().parent / "README.template.md", self.output_dir / "README.md")
+        build_info = {
+            'build_date': self._now_str,
+            'platform': platform.platform(),
+            'implementations': self.build_artifacts.names(),
+        }
+        (self.output_dir / "build_info.json").write_bytes(json.dumps(build_info, indent=2).encode('utf-8'))
         
         # Create run script for convenience
-        if self.platform == "windows":
+        if self.is_windows:
             run_script = self.output_dir / "run.bat"
-            with open(run_script, 'w') as f:
-                f.write(f'@echo off\n"{final_exe_name}" %*\npause\n')
+            run_lines = ['@echo off', f'"vmtest_portable\\{final_exe_name}" %*', 'pause', '']
         else:
             run_script = self.output_dir / "run.sh"
-            with open(run_script, 'w') as f:
-                f.write(f'#!/bin/bash\n"./{final_exe_name}" "$@"\n')
+            # exec replaces the shell, so the runner owns the terminal and exit status directly
+            run_lines = ['#!/bin/sh', f'exec "$(dirname "$0")/vmtest_portable/{final_exe_name}" "$@"', '']
+        run_script.write_bytes(os.linesep.join(run_lines).encode('utf-8'))
+        if not self.is_windows:
             os.chmod(run_script, 0o755)
         
         self.log(f"✅ Package created: {self.output_dir}")
         return self.output_dir
 
+    def _make_archive(self, archive_base, package_dir):
+        """Archive package_dir next to it, using parallel gzip (pigz) for large packages"""
+        if not self.is_windows and _which("pigz"):
+            size = sum(p.stat().st_size for p in package_dir.rglob('*') if p.is_file())
+            if size >= _PIGZ_MIN_BYTES:
+                threads = self._archive_threads()
+                # run_command works in temp_dir, so relative --output paths must be resolved here
+                archive_path = f"{Path(archive_base).resolve()}.tar.gz"
+                if self.run_command(["tar", f"--use-compress-program=pigz -p {threads}", "-cf", archive_path,
+                                     "-C", str(package_dir.resolve().parent), package_dir.name]):
+                    return archive_path
+                self.log("⚠️  pigz archive failed, falling back to gzip")
+        
+        return shutil.make_archive(
+            str(archive_base),
+            'zip' if self.is_windows else 'gztar',
+            root_dir=package_dir.parent,
+            base_dir=package_dir.name
+        )
+
+    def _archive_threads(self):
+        """pigz thread count: VMTEST_ARCHIVE_THREADS if it is a positive integer, else the CPU count"""
+        value = os.environ.get("VMTEST_ARCHIVE_THREADS")
+        if value is not None:
+            try:
+                threads = int(value)
+            except ValueError:
+                threads = 0
+            if threads >= 1:
+                return threads
+            self.log(f"⚠️  Ignoring VMTEST_ARCHIVE_THREADS={value!r}: expected a positive integer")
+        return os.cpu_count() or 1
+
     def build_all(self):
         """Build everything"""
         self.log("🚀 Starting integrated build process...")
         
         try:
             # Step 1: Build individual language implementations
+            # These steps are independent (compiler, PyInstaller, network
+            # download, file copies), so run them concurrently.
             self.log("Phase 1: Building language implementations...")
-            self.build_c_executable()
-            self.build_python_executable()
-            self.download_nodejs()
-            self.create_ruby_wrapper()
+            with ThreadPoolExecutor(max_workers=4) as ex:
+                futures = {
+                    ex.submit(fn): name for fn, name in [
+                        (self.build_c_executable, 'c'),
+                        (self.build_python_executable, 'python'),
+                        (self.download_nodejs, 'nodejs'),
+                        (self.create_ruby_wrapper, 'ruby'),
+                    ]
+                }
+                wait(futures)
+            
+            for future, name in futures.items():
+                if future.exception():
+                    self.log(f"❌ {name} build error: {future.exception()}")
             
             if not self.build_artifacts:
                 self.log("❌ No implementations built successfully!")
                 return None
             
-            self.log(f"Built implementations: {list(self.build_artifacts.keys())}")
+            self.log(f"Built implementations: {self.build_artifacts.names()}")
             
             # Step 2: Build unified runner executable
             self.log("Phase 2: Creating unified portable executable...")
-            unified_exe = self.create_unified_runner_executable()
+            unified_dir = self.create_unified_runner_executable()
             
-            if not unified_exe:
+            if not unified_dir:
                 self.log("❌ Failed to create unified executable!")
                 return None
             
             # Step 3: Create final package
             self.log("Phase 3: Creating final package...")
-            final_package = self.create_final_package(unified_exe)
+            final_package = self.create_final_package(unified_dir)
             
             # Calculate build time
             build_time = time.time() - self.build_start_time
@@ -524,15 +1136,15 @@ Enjoy your portable VM detection toolkit! 🚀
             self.log("=" * 60)
             self.log(f"⏱️  Build time: {build_time:.1f} seconds")
             self.log(f"📁 Package: {final_package}")
-            self.log(f"🚀 Executable: {final_package / ('vmtest_portable' + ('.exe' if self.platform == 'windows' else ''))}")
+            self.log(f"🚀 Executable: {final_package / 'vmtest_portable' / ('vmtest_portable' + self._exe_suffix)}")
             self.log("")
             self.log("Built components:")
-            for name in self.build_artifacts:
+            for name in self.build_artifacts.names():
                 self.log(f"  ✅ {name.upper()}")
             self.log("")
             self.log("🚀 TO USE:")
             self.log(f"  cd {final_package.name}")
-            self.log(f"  ./vmtest_portable{'(.exe' if self.platform == 'windows' else ''}")
+            self.log(f"  ./vmtest_portable/vmtest_portable{self._exe_suffix}")
             self.log("")
             self.log("💡 This is a completely portable, self-contained VM detection suite!")
             
@@ -544,22 +1156,46 @@ Enjoy your portable VM detection toolkit! 🚀
             traceback.print_exc()
             return None
         finally:
-            # Cleanup temp directory
-            try:
-                shutil.rmtree(self.temp_dir)
-                self.log(f"🧹 Cleaned up temp directory: {self.temp_dir}")
-            except:
-                pass
+            self._cleanup_temp_dir()
+
+    def _cleanup_temp_dir(self):
+        """Move the temp directory aside and delete it in the background"""
+        trash_dir = self.temp_dir.with_name(self.temp_dir.name + ".trash")
+        try:
+            os.rename(self.temp_dir, trash_dir)
+        except OSError:
+            trash_dir = self.temp_dir
+        
+        # A detached native rm outlives this process and avoids per-file Python overhead
+        if self.is_windows:
+            cmd = ["cmd", "/c", "rmdir", "/s", "/q", str(trash_dir)]
+            spawn_kwargs = {'creationflags': subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            cmd = ["rm", "-rf", str(trash_dir)]
+            spawn_kwargs = {'start_new_session': True}
+        try:
+            subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL, **spawn_kwargs)
+        except OSError:
+            threading.Thread(target=shutil.rmtree, args=(trash_dir,),
+                             kwargs={'ignore_errors': True}, daemon=True).start()
+        self.log(f"🧹 Cleaning up temp directory in background: {trash_dir}")
 
 
 def main():
     parser = argparse.ArgumentParser(
-        description='Integrated VMtest Portable Builder - Creates a single executable containing all implementations'
+        description='Integrated VMtest Portable Builder - Creates a single executable containing all implementations',
+        epilog='Environment: VMTEST_ARCHIVE_THREADS sets the number of pigz threads used to '
+               'compress the release archive (default: CPU count)'
     )
     parser.add_argument('--output', '-o', default='vmtest_complete_portable',
                         help='Output directory (default: vmtest_complete_portable)')
     parser.add_argument('--clean', action='store_true',
                         help='Clean output directory first')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Stream build tool output')
+    parser.add_argument('--auto-install', action='store_true',
+                        help='pip install PyInstaller if it is missing')
     
     args = parser.parse_args()
     
@@ -568,14 +1204,15 @@ def main():
         shutil.rmtree(args.output)
     
     try:
-        builder = IntegratedPortableBuilder(args.output)
+        builder = IntegratedPortableBuilder(args.output, verbose=args.verbose,
+                                            auto_install=args.auto_install)
         package_dir = builder.build_all()
         
         if package_dir:
             print(f"\n🎉 Success! Your complete portable VMtest suite is ready!")
             print(f"📍 Location: {package_dir}")
-            exe_name = "vmtest_portable" + (".exe" if platform.system() == "Windows" else "")
-            print(f"🚀 Run with: cd {package_dir.name} && ./{exe_name}")
+            exe_name = "vmtest_portable" + builder._exe_suffix
+            print(f"🚀 Run with: cd {package_dir.name} && ./vmtest_portable/{exe_name}")
             return 0
         else:
             print("❌ Build failed!")
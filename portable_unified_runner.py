@@ -12,40 +12,106 @@ import sys
 import time
 import subprocess
 import platform
-import shutil
 import argparse
 import tempfile
 import zipfile
 import socket
 import uuid
 import getpass
+import gzip
+import threading
+from array import array
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from datetime import datetime
 from pathlib import Path
-import requests
+
+try:
+    import orjson  # Optional; much faster report serialization when installed
+except ImportError:
+    orjson = None
+
+# Implementations in run and report order
+_LANGUAGES = ('c', 'python', 'nodejs', 'ruby')
+
+# Decodes the JSON document embedded in an implementation's stdout
+_JSON_DECODER = json.JSONDecoder()
+
+# Stands in for the vmtest.c path in the C compile argv
+_SRC_PLACEHOLDER = object()
+
+# System interpreter used when no portable build is bundled
+_INTERPRETER = {'python': 'python3', 'nodejs': 'node', 'ruby': 'ruby'}
+
+# Shared fallback for missing report sections; never mutated
+_EMPTY = {}
+
+# Host identity fields shown in the Discord message and console summary
+_SummaryCtx = namedtuple('_SummaryCtx', ['machine_name', 'platform', 'machine', 'ips', 'mac', 'machine_id', 'cpu_count'])
+
+# Per-language detection labels, indexed by the likely_vm verdict
+_VM_STATUS_SHORT = ("✅ Physical", "🚨 VM")
+_VM_STATUS_LONG = ("Physical", "VM DETECTED")
+_VM_STATUS_TEXT = ("Physical machine", "VM detected")
 
 class PortableUnifiedRunner:
+    # Measurement rows, in report order
+    measurement_keys = [
+        'TIMING_BASIC_MEAN', 'TIMING_BASIC_VARIANCE', 'TIMING_BASIC_CV',
+        'TIMING_BASIC_SKEWNESS', 'TIMING_BASIC_KURTOSIS',
+        'TIMING_CONSECUTIVE_MEAN', 'TIMING_CONSECUTIVE_VARIANCE', 'TIMING_CONSECUTIVE_CV',
+        'TIMING_CONSECUTIVE_SKEWNESS', 'TIMING_CONSECUTIVE_KURTOSIS',
+        'SCHEDULING_THREAD_MEAN', 'SCHEDULING_THREAD_VARIANCE', 'SCHEDULING_THREAD_CV',
+        'SCHEDULING_THREAD_SKEWNESS', 'SCHEDULING_THREAD_KURTOSIS',
+        'PHYSICAL_MACHINE_INDEX',
+        'SCHEDULING_MULTIPROC_MEAN', 'SCHEDULING_MULTIPROC_VARIANCE', 'SCHEDULING_MULTIPROC_CV',
+        'SCHEDULING_MULTIPROC_SKEWNESS', 'SCHEDULING_MULTIPROC_KURTOSIS',
+        'MULTIPROC_PHYSICAL_MACHINE_INDEX',
+        'CACHE_ACCESS_RATIO', 'CACHE_MISS_RATIO',
+        'MEMORY_ADDRESS_ENTROPY',
+        'OVERALL_TIMING_CV', 'OVERALL_SCHEDULING_CV'
+    ]
+
+    # Machine indexes span many orders of magnitude, so they use scientific notation
+    _SCI_KEYS = frozenset({'PHYSICAL_MACHINE_INDEX', 'MULTIPROC_PHYSICAL_MACHINE_INDEX'})
+    _FMT = dict.fromkeys(measurement_keys, '{:.6f}'.format)
+    _FMT.update(dict.fromkeys(_SCI_KEYS, '{:.6e}'.format))
+
+    # Pseudo filesystems left out of the disk usage report
+    _SKIP_FSTYPES = frozenset({'squashfs', 'overlay', 'tmpfs', 'devtmpfs'})
+
+    # Webhook attachments at least this big are uploaded gzipped
+    _GZIP_MIN_BYTES = 8 * 1024
+    # Stand-in for individual_results while the report is encoded; swapped for the pre-serialized results
+    _RESULTS_MARKER = '\x00individual_results\x00'
+
     def __init__(self, iterations=1000, output_dir=None, verbose=False, portable_mode=False, webhook_url=None):
         self.iterations = iterations
-        self.output_dir = output_dir or tempfile.mkdtemp(prefix="vmtest_")
+        self.output_dir = os.fspath(output_dir) if output_dir else tempfile.mkdtemp(prefix="vmtest_")
+        os.makedirs(self.output_dir, exist_ok=True)
+        # Every artifact lands directly in output_dir, so join paths by prefix
+        self._out_prefix = self.output_dir + os.sep
         self.verbose = verbose
         self.portable_mode = portable_mode
         self.webhook_url = webhook_url  # ADD THIS LINE
+        
+        # Shared HTTP session, built on the first webhook post (see _http_session)
+        self._http = None
         self.results = {}
-        self.measurement_keys = [
-            'TIMING_BASIC_MEAN', 'TIMING_BASIC_VARIANCE', 'TIMING_BASIC_CV',
-            'TIMING_BASIC_SKEWNESS', 'TIMING_BASIC_KURTOSIS',
-            'TIMING_CONSECUTIVE_MEAN', 'TIMING_CONSECUTIVE_VARIANCE', 'TIMING_CONSECUTIVE_CV',
-            'TIMING_CONSECUTIVE_SKEWNESS', 'TIMING_CONSECUTIVE_KURTOSIS',
-            'SCHEDULING_THREAD_MEAN', 'SCHEDULING_THREAD_VARIANCE', 'SCHEDULING_THREAD_CV',
-            'SCHEDULING_THREAD_SKEWNESS', 'SCHEDULING_THREAD_KURTOSIS',
-            'PHYSICAL_MACHINE_INDEX',
-            'SCHEDULING_MULTIPROC_MEAN', 'SCHEDULING_MULTIPROC_VARIANCE', 'SCHEDULING_MULTIPROC_CV',
-            'SCHEDULING_MULTIPROC_SKEWNESS', 'SCHEDULING_MULTIPROC_KURTOSIS',
-            'MULTIPROC_PHYSICAL_MACHINE_INDEX',
-            'CACHE_ACCESS_RATIO', 'CACHE_MISS_RATIO',
-            'MEMORY_ADDRESS_ENTROPY',
-            'OVERALL_TIMING_CV', 'OVERALL_SCHEDULING_CV'
-        ]
+        self._agg = None
+        self.execution_log = []
+        
+        # Host properties that cannot change during a run, probed at most once
+        self._os = platform.system()
+        self._sys_cache = {}
+        self._path_index = None
+        self._exec_cache = {}
+        self._machine_id = None
+        self._mac = None
+        self._log_lock = threading.Lock()
+        self._last_sec = -1
+        self._last_ts = ''
     
         # Determine if we're running as a PyInstaller bundle
         if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
@@ -59,62 +125,87 @@ class PortableUnifiedRunner:
         
     def _get_implementation_config(self):
         """Get implementation configuration with portable and fallback options"""
-        platform_suffix = ".exe" if platform.system() == "Windows" else ""
+        platform_suffix = ".exe" if self._os == "Windows" else ""
         
         return {
             'c': {
                 'portable_binary': f'vmtest{platform_suffix}',
                 'source': 'vmtest.c',
                 'compile_cmd': self._get_c_compile_cmd(),
-                'fallback_cmd': f'./vmtest{platform_suffix}'
+                'fallback_cmd': [os.path.join('.', f'vmtest{platform_suffix}')]
             },
             'python': {
                 'portable_binary': f'vmtest_python{platform_suffix}',
                 'source': 'vmtest.py',
-                'fallback_cmd': f'python3 vmtest.py {self.iterations}'
+                'fallback_cmd': ['python3', 'vmtest.py', str(self.iterations)]
             },
             'nodejs': {
                 'portable_binary': 'node' + platform_suffix,
                 'source': 'vmtest.js',
                 'js_file': 'vmtest.js',  # ENSURE THIS IS PRESENT
-                'fallback_cmd': f'node vmtest.js {self.iterations}'
+                'fallback_cmd': ['node', 'vmtest.js', str(self.iterations)]
             },
             'ruby': {
                 'portable_binary': f'vmtest_ruby{platform_suffix}',
                 'source': 'vmtest.rb', 
-                'fallback_cmd': f'ruby vmtest.rb {self.iterations}'
+                'fallback_cmd': ['ruby', 'vmtest.rb', str(self.iterations)]
             }
         }
 
     def _get_c_compile_cmd(self):
         """Get appropriate C compilation command for the platform"""
-        if platform.system() == 'Darwin':  # macOS
-            return 'gcc -o vmtest vmtest.c -lpthread -lm -O2'
-        elif platform.system() == 'Linux':
-            return 'gcc -o vmtest vmtest.c -lpthread -lm -lrt -O2'
-        else:  # Windows
-            return 'gcc -o vmtest.exe vmtest.c -lpthread -lm -O2'
+        return {
+            'Darwin': ['gcc', '-o', 'vmtest', _SRC_PLACEHOLDER, '-lpthread', '-lm', '-O2'],
+            'Linux': ['gcc', '-o', 'vmtest', _SRC_PLACEHOLDER, '-lpthread', '-lm', '-lrt', '-O2'],
+        }.get(self._os, ['gcc', '-o', 'vmtest.exe', _SRC_PLACEHOLDER, '-lpthread', '-lm', '-O2'])  # Windows
+
+    def _find_on_path(self, name):
+        """Resolve a command from a single cached scan of the PATH directories"""
+        if self._path_index is None:
+            index = {}
+            exts = [ext.lower() for ext in os.environ.get('PATHEXT', '').split(os.pathsep) if ext] \
+                if self._os == 'Windows' else []
+            for directory in os.environ.get('PATH', '').split(os.pathsep):
+                try:
+                    with os.scandir(directory or '.') as entries:
+                        for entry in entries:
+                            # Candidates in PATH order; only the looked-up name is checked below
+                            index.setdefault(entry.name, []).append(entry.path)
+                            stem, ext = os.path.splitext(entry.name)
+                            if ext.lower() in exts:
+                                index.setdefault(stem, []).append(entry.path)
+                except OSError:
+                    continue
+            self._path_index = index
+        # First executable regular file wins, as with shutil.which
+        for path in self._path_index.get(name, ()):
+            if os.path.isfile(path) and os.access(path, os.X_OK):
+                return path
+        return None
+
+    def _cached_probe(self, name, probe):
+        """Return a host property, calling probe() only the first time"""
+        if name not in self._sys_cache:
+            self._sys_cache[name] = probe()
+        return self._sys_cache[name]
 
     def _log(self, message, level='INFO'):
         """Log message with timestamp to both console and results"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        prefix = f"[{timestamp}] [{level}]"
-        formatted_message = f"{prefix} {message}"
-        
-        # Print to console
-        print(formatted_message)
-        
-        # Store in log for later inclusion in results
-        if not hasattr(self, 'execution_log'):
-            self.execution_log = []
-        self.execution_log.append({
-            'timestamp': timestamp,
-            'level': level,
-            'message': message
-        })
-        
-        if self.verbose or level in ['ERROR', 'WARNING']:
-            sys.stdout.flush()
+        # System probes run on worker threads, so keep each line and log entry whole
+        with self._log_lock:
+            # Reformat the timestamp only when the wall-clock second changes
+            sec = int(time.time())
+            if sec != self._last_sec:
+                self._last_sec = sec
+                self._last_ts = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+            line = f"[{self._last_ts}] [{level}] {message}\n"
+            
+            # Print to console, and keep the same line for the report
+            sys.stdout.write(line)
+            self.execution_log.append(line)
+            
+            if level in ('ERROR', 'WARNING'):
+                sys.stdout.flush()
 
     def _gather_system_info(self):
         """Gather comprehensive system identification information"""
@@ -129,95 +220,74 @@ class PortableUnifiedRunner:
             'environment_info': {}
         }
         
+        # Network, DNS and subprocess probes are independent, so overlap them
+        probed = self._run_system_probes({
+            'fqdn': socket.getfqdn,
+            'ip_addresses': self._probe_ip_addresses,
+            'mac_address': self._probe_mac_address,
+            'machine_id': self._get_machine_id,
+            'boot_time': self._get_boot_time,
+            'psutil_hardware': self._probe_psutil_hardware,
+        })
+        
         # Basic system information
         try:
-            system_info['basic_info'] = {
-                'machine_name': platform.node(),
-                'hostname': socket.gethostname(),
-                'fqdn': socket.getfqdn(),
-                'platform': platform.platform(),
-                'system': platform.system(),
-                'release': platform.release(),
-                'version': platform.version(),
-                'machine': platform.machine(),
-                'processor': platform.processor(),
-                'architecture': platform.architecture(),
-                'python_version': platform.python_version(),
-                'python_implementation': platform.python_implementation()
-            }
+            if hasattr(os, 'uname'):
+                # One uname() call covers node, release, version and machine
+                uname = os.uname()
+                system_info['basic_info'] = {
+                    'machine_name': uname.nodename,
+                    'hostname': self._cached_probe('hostname', socket.gethostname),
+                    'fqdn': self._cached_probe('fqdn', socket.getfqdn),
+                    'platform': platform.platform(),
+                    'system': uname.sysname,
+                    'release': uname.release,
+                    'version': uname.version,
+                    'machine': uname.machine,
+                    'processor': platform.processor(),
+                    'architecture': platform.architecture(),
+                    'python_version': '.'.join(map(str, sys.version_info[:3])),
+                    'python_implementation': platform.python_implementation()
+                }
+            else:
+                system_info['basic_info'] = {
+                    'machine_name': self._cached_probe('node', platform.node),
+                    'hostname': self._cached_probe('hostname', socket.gethostname),
+                    'fqdn': self._cached_probe('fqdn', socket.getfqdn),
+                    'platform': platform.platform(),
+                    'system': self._os,
+                    'release': platform.release(),
+                    'version': platform.version(),
+                    'machine': self._cached_probe('machine', platform.machine),
+                    'processor': platform.processor(),
+                    'architecture': platform.architecture(),
+                    'python_version': platform.python_version(),
+                    'python_implementation': platform.python_implementation()
+                }
         except Exception as e:
             self._log(f"Error gathering basic info: {e}", 'WARNING')
         
         # Network information
         try:
-            # Get IP addresses
-            ip_addresses = []
-            try:
-                # Get local IP by connecting to external address
-                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                s.connect(("8.8.8.8", 80))
-                local_ip = s.getsockname()[0]
-                s.close()
-                ip_addresses.append(local_ip)
-            except:
-                pass
-            
-            # Get all network interfaces (if available)
-            try:
-                import netifaces
-                for interface in netifaces.interfaces():
-                    addrs = netifaces.ifaddresses(interface)
-                    if netifaces.AF_INET in addrs:
-                        for addr in addrs[netifaces.AF_INET]:
-                            if addr['addr'] not in ip_addresses:
-                                ip_addresses.append(addr['addr'])
-            except ImportError:
-                # netifaces not available, try alternative method
-                try:
-                    hostname = socket.gethostname()
-                    ip_list = socket.gethostbyname_ex(hostname)[2]
-                    for ip in ip_list:
-                        if ip not in ip_addresses and not ip.startswith("127."):
-                            ip_addresses.append(ip)
-                except:
-                    pass
-            
             system_info['network_info'] = {
-                'ip_addresses': ip_addresses,
-                'hostname': socket.gethostname(),
-                'fqdn': socket.getfqdn()
+                'ip_addresses': probed['ip_addresses'] or [],
+                'hostname': self._cached_probe('hostname', socket.gethostname),
+                'fqdn': self._cached_probe('fqdn', socket.getfqdn)
             }
-            
-            # Try to get MAC address
-            try:
-                mac = ':'.join(['{:02x}'.format((uuid.getnode() >> elements) & 0xff) for elements in range(0,2*6,2)][::-1])
-                system_info['network_info']['mac_address'] = mac
-            except:
-                pass
-                
+            if probed['mac_address']:
+                system_info['network_info']['mac_address'] = probed['mac_address']
         except Exception as e:
             self._log(f"Error gathering network info: {e}", 'WARNING')
         
         # Hardware information
         try:
             system_info['hardware_info'] = {
-                'machine_id': self._get_machine_id(),
+                'machine_id': probed['machine_id'] or str(uuid.uuid4()),
                 'cpu_count': os.cpu_count(),
-                'boot_time': self._get_boot_time()
+                'boot_time': probed['boot_time']
             }
-            
-            # Try to get more hardware details
-            try:
-                import psutil
-                system_info['hardware_info'].update({
-                    'cpu_freq': psutil.cpu_freq()._asdict() if psutil.cpu_freq() else None,
-                    'memory_total': psutil.virtual_memory().total,
-                    'disk_usage': {partition.device: psutil.disk_usage(partition.mountpoint)._asdict() 
-                                 for partition in psutil.disk_partitions()},
-                })
-            except ImportError:
-                pass
-                
+            if probed['psutil_hardware']:
+                system_info['hardware_info'].update(probed['psutil_hardware'])
         except Exception as e:
             self._log(f"Error gathering hardware info: {e}", 'WARNING')
         
@@ -257,11 +327,127 @@ class PortableUnifiedRunner:
         
         return system_info
 
+    def _run_system_probes(self, probes, timeout=2.0):
+        """Run independent probes concurrently; a probe that fails or overruns yields None"""
+        outcomes = {}
+        
+        def run(name, probe):
+            try:
+                outcomes[name] = (probe(), None)
+            except Exception as e:
+                outcomes[name] = (None, e)
+        
+        # Daemon threads, so a hung probe (e.g. a DNS lookup) cannot delay interpreter exit
+        threads = {name: threading.Thread(target=run, args=(name, probe), daemon=True)
+                   for name, probe in probes.items()}
+        for thread in threads.values():
+            thread.start()
+        
+        deadline = time.monotonic() + timeout
+        results = {}
+        for name, thread in threads.items():
+            thread.join(max(0.0, deadline - time.monotonic()))
+            value, error = outcomes.get(name, (None, None))
+            if name not in outcomes or error is not None:
+                self._log(f"System probe '{name}' unavailable: {str(error or '') or 'timed out'}", 'WARNING')
+            results[name] = value
+        
+        # Later lookups reuse this answer; an overrun reverse lookup falls back to the plain hostname
+        if 'fqdn' in probes:
+            self._sys_cache['fqdn'] = results['fqdn'] or self._cached_probe('hostname', socket.gethostname)
+        return results
+
+    def _probe_ip_addresses(self):
+        """Collect the host's non-loopback IPv4 addresses"""
+        ip_addresses = []
+        try:
+            # Get local IP by connecting to external address (UDP, nothing is sent)
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            s.settimeout(1.0)
+            try:
+                s.connect(("8.8.8.8", 80))
+                ip_addresses.append(s.getsockname()[0])
+            finally:
+                s.close()
+        except:
+            pass
+        
+        # Get all network interfaces (if available)
+        try:
+            import netifaces
+            for interface in netifaces.interfaces():
+                addrs = netifaces.ifaddresses(interface)
+                if netifaces.AF_INET in addrs:
+                    for addr in addrs[netifaces.AF_INET]:
+                        if addr['addr'] not in ip_addresses:
+                            ip_addresses.append(addr['addr'])
+        except ImportError:
+            # netifaces not available, try alternative method
+            try:
+                hostname = self._cached_probe('hostname', socket.gethostname)
+                ip_list = socket.gethostbyname_ex(hostname)[2]
+                for ip in ip_list:
+                    if ip not in ip_addresses and not ip.startswith("127."):
+                        ip_addresses.append(ip)
+            except:
+                pass
+        return ip_addresses
+
+    def _probe_mac_address(self):
+        """MAC address as reported by uuid.getnode(), computed once per runner"""
+        if self._mac is None:
+            mac = f'{uuid.getnode():012x}'
+            self._mac = ':'.join(mac[i:i+2] for i in range(0, 12, 2))
+        return self._mac
+
+    def _probe_psutil_hardware(self):
+        """Extra hardware details when psutil is installed"""
+        try:
+            import psutil
+        except ImportError:
+            return None
+        return {
+            'cpu_freq': psutil.cpu_freq()._asdict() if psutil.cpu_freq() else None,
+            'memory_total': psutil.virtual_memory().total,
+            'disk_usage': self._cached_probe('disk_usage', lambda: self._probe_disk_usage(psutil)),
+        }
+
+    def _probe_disk_usage(self, psutil):
+        """Usage of each real disk, one statvfs per device"""
+        disks = {}
+        for partition in psutil.disk_partitions(all=False):
+            # Snap images, overlays and repeat mounts of a device add nothing new
+            if partition.fstype in self._SKIP_FSTYPES or partition.device in disks:
+                continue
+            try:
+                if hasattr(os, 'statvfs'):
+                    st = os.statvfs(partition.mountpoint)
+                    total = st.f_blocks * st.f_frsize
+                    free = st.f_bavail * st.f_frsize
+                    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+                    disks[partition.device] = {
+                        'total': total,
+                        'used': used,
+                        'free': free,
+                        'percent': round(used / (used + free) * 100, 1) if used + free else 0.0
+                    }
+                else:
+                    disks[partition.device] = psutil.disk_usage(partition.mountpoint)._asdict()
+            except OSError:
+                continue
+        return disks
+
     def _get_machine_id(self):
-        """Get unique machine identifier"""
+        """Get unique machine identifier, read once per runner"""
+        if self._machine_id is None:
+            self._machine_id = self._read_machine_id()
+        return self._machine_id
+
+    def _read_machine_id(self):
+        """Read the machine identifier from the OS"""
         try:
             # Try different methods to get machine ID
-            if platform.system() == 'Linux':
+            if self._os == 'Linux':
                 try:
                     with open('/etc/machine-id', 'r') as f:
                         return f.read().strip()
@@ -271,7 +457,7 @@ class PortableUnifiedRunner:
                             return f.read().strip()
                     except:
                         pass
-            elif platform.system() == 'Windows':
+            elif self._os == 'Windows':
                 try:
                     import winreg
                     key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
@@ -281,7 +467,7 @@ class PortableUnifiedRunner:
                     return value
                 except:
                     pass
-            elif platform.system() == 'Darwin':
+            elif self._os == 'Darwin':
                 try:
                     result = subprocess.run(['ioreg', '-rd1', '-c', 'IOPlatformExpertDevice'], 
                                           capture_output=True, text=True)
@@ -298,26 +484,27 @@ class PortableUnifiedRunner:
             return str(uuid.uuid4())
 
     def _get_boot_time(self):
-        """Get system boot time"""
+        """Get system boot time, read once per runner"""
+        return self._cached_probe('boot_time', self._read_boot_time)
+
+    def _read_boot_time(self):
+        """Read the system boot time from the OS"""
         try:
             import psutil
             return datetime.fromtimestamp(psutil.boot_time()).isoformat()
         except ImportError:
             try:
-                if platform.system() == 'Linux':
-                    with open('/proc/uptime', 'r') as f:
-                        uptime_seconds = float(f.readline().split()[0])
-                        boot_time = time.time() - uptime_seconds
-                        return datetime.fromtimestamp(boot_time).isoformat()
-                elif platform.system() == 'Windows':
-                    import subprocess
-                    result = subprocess.run(['wmic', 'os', 'get', 'LastBootUpTime'], 
-                                          capture_output=True, text=True)
-                    for line in result.stdout.split('\n'):
-                        if line.strip() and 'LastBootUpTime' not in line:
-                            # Parse Windows timestamp format
-                            timestamp = line.strip()[:14]
-                            return datetime.strptime(timestamp, '%Y%m%d%H%M%S').isoformat()
+                if self._os == 'Linux':
+                    # btime is the kernel's own record of the boot instant
+                    with open('/proc/stat', 'r') as f:
+                        for line in f:
+                            if line.startswith('btime'):
+                                return datetime.fromtimestamp(int(line.split()[1])).isoformat()
+                elif self._os == 'Windows':
+                    import ctypes
+                    ctypes.windll.kernel32.GetTickCount64.restype = ctypes.c_uint64
+                    uptime_seconds = ctypes.windll.kernel32.GetTickCount64() / 1000.0
+                    return datetime.fromtimestamp(time.time() - uptime_seconds).isoformat()
             except:
                 pass
         except:
@@ -331,7 +518,7 @@ class PortableUnifiedRunner:
         self._log("=" * 70)
         
         # Basic info
-        basic = system_info.get('basic_info', {})
+        basic = system_info.get('basic_info') or _EMPTY
         self._log(f"Machine Name: {basic.get('machine_name', 'Unknown')}")
         self._log(f"Hostname: {basic.get('hostname', 'Unknown')}")
         self._log(f"FQDN: {basic.get('fqdn', 'Unknown')}")
@@ -339,14 +526,14 @@ class PortableUnifiedRunner:
         self._log(f"Architecture: {basic.get('machine', 'Unknown')} / {basic.get('processor', 'Unknown')}")
         
         # Network info
-        network = system_info.get('network_info', {})
+        network = system_info.get('network_info') or _EMPTY
         if network.get('ip_addresses'):
             self._log(f"IP Addresses: {', '.join(network['ip_addresses'])}")
         if network.get('mac_address'):
             self._log(f"MAC Address: {network['mac_address']}")
         
         # Hardware info
-        hardware = system_info.get('hardware_info', {})
+        hardware = system_info.get('hardware_info') or _EMPTY
         if hardware.get('machine_id'):
             self._log(f"Machine ID: {hardware['machine_id']}")
         if hardware.get('cpu_count'):
@@ -355,14 +542,14 @@ class PortableUnifiedRunner:
             self._log(f"Boot Time: {hardware['boot_time']}")
         
         # User info
-        user = system_info.get('user_info', {})
+        user = system_info.get('user_info') or _EMPTY
         if user.get('username'):
             self._log(f"Current User: {user['username']}")
         if user.get('current_directory'):
             self._log(f"Working Directory: {user['current_directory']}")
         
         # Environment highlights
-        env = system_info.get('environment_info', {})
+        env = system_info.get('environment_info') or _EMPTY
         if env.get('COMPUTERNAME'):
             self._log(f"Computer Name: {env['COMPUTERNAME']}")
         if env.get('USERDOMAIN'):
@@ -372,7 +559,13 @@ class PortableUnifiedRunner:
         
         self._log("=" * 70)
     def _find_portable_executable(self, lang):
-        """Find portable executable for a language implementation"""
+        """Find portable executable for a language implementation (cached per language)"""
+        if lang not in self._exec_cache:
+            self._exec_cache[lang] = self._locate_portable_executable(lang)
+        return self._exec_cache[lang]
+
+    def _locate_portable_executable(self, lang):
+        """Search the bundle and working directories for a language's executable"""
         impl = self.implementations[lang]
         
         # Special handling for Node.js FIRST (before checking standalone executable)
@@ -398,23 +591,22 @@ class PortableUnifiedRunner:
                         # Return special format to indicate Node.js needs special handling
                         return f'NODEJS_SPECIAL:{node_binary}:{js_path}'
                 
-                # DEBUG: List all files in bundle directory
+                # If we find any .js file, use the first one
                 try:
-                    bundle_files = list(self.bundle_dir.iterdir())
-                    self._log(f"DEBUG: All files in bundle directory: {[f.name for f in bundle_files]}")
-                    
-                    # Look for any .js files
-                    js_files = [f for f in bundle_files if f.name.endswith('.js')]
-                    self._log(f"DEBUG: Found .js files: {[f.name for f in js_files]}")
-                    
-                    # If we find any .js file, use the first one
-                    if js_files:
-                        js_file = js_files[0]
+                    js_file = next(self.bundle_dir.glob('*.js'), None)
+                    if js_file:
                         self._log(f"Using found JS file: {js_file}")
                         return f'NODEJS_SPECIAL:{node_binary}:{js_file}'
-                        
-                except Exception as e:
-                    self._log(f"DEBUG: Could not list bundle directory: {e}")
+                except OSError as e:
+                    self._log(f"DEBUG: Could not search bundle directory: {e}")
+                
+                # DEBUG: List all files in bundle directory
+                if self.verbose:
+                    try:
+                        bundle_files = [f.name for f in self.bundle_dir.iterdir()]
+                        self._log(f"DEBUG: All files in bundle directory: {bundle_files}")
+                    except Exception as e:
+                        self._log(f"DEBUG: Could not list bundle directory: {e}")
                 
                 self._log(f"Node.js binary found but no JS file at: {js_locations}")
                 # Don't return the Node.js binary alone - it won't work without JS
@@ -430,15 +622,17 @@ class PortableUnifiedRunner:
         local_path = Path(impl['portable_binary'])
         if local_path.exists() and os.access(local_path, os.X_OK):
             self._log(f"Found local {lang.upper()} executable: {local_path}")
-            return str(local_path)
+            # Absolute, since a bare name would be looked up on PATH
+            return str(local_path.resolve())
         
         return None
 
     def _check_dependencies(self):
         """Check available implementations (portable first, then system)"""
         available = {}
+        interpreters = {}
         
-        for lang in ['c', 'python', 'nodejs', 'ruby']:
+        for lang in _LANGUAGES:
             # First try to find portable executable
             portable_exec = self._find_portable_executable(lang)
             if portable_exec:
@@ -449,7 +643,7 @@ class PortableUnifiedRunner:
             if lang == 'c':
                 # Check if source exists and we can compile
                 if (self.bundle_dir / 'vmtest.c').exists() or Path('vmtest.c').exists():
-                    if shutil.which('gcc'):
+                    if self._find_on_path('gcc'):
                         available[lang] = "source + gcc"
                         self._log(f"{lang.upper()} available: source compilation")
                     else:
@@ -458,20 +652,38 @@ class PortableUnifiedRunner:
                     self._log(f"{lang.upper()} source not found", 'WARNING')
             else:
                 # Check system interpreter
-                interpreter = {'python': 'python3', 'nodejs': 'node', 'ruby': 'ruby'}[lang]
-                try:
-                    result = subprocess.run([interpreter, '--version'], 
-                                          capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
-                        version = result.stdout.strip().split('\n')[0]
-                        available[lang] = f"system: {version}"
-                        self._log(f"{lang.upper()} available: {version}")
-                    else:
-                        self._log(f"{lang.upper()} not available", 'WARNING')
-                except (subprocess.TimeoutExpired, FileNotFoundError):
+                interpreter_path = self._find_on_path(_INTERPRETER[lang])
+                if interpreter_path:
+                    interpreters[lang] = interpreter_path
+                else:
                     self._log(f"{lang.upper()} not available", 'WARNING')
-                    
-        return available
+        
+        # Only spawn --version probes when someone will read them, and run them together
+        versions = dict(interpreters)
+        if self.verbose and interpreters:
+            with ThreadPoolExecutor(max_workers=len(interpreters)) as executor:
+                futures = {lang: executor.submit(self._probe_version, path) for lang, path in interpreters.items()}
+            versions = {lang: future.result() for lang, future in futures.items()}
+        
+        for lang in interpreters:
+            if versions[lang] is None:
+                self._log(f"{lang.upper()} not available", 'WARNING')
+                continue
+            available[lang] = f"system: {versions[lang]}"
+            self._log(f"{lang.upper()} available: {versions[lang]}")
+        
+        return {lang: available[lang] for lang in _LANGUAGES if lang in available}
+
+    def _probe_version(self, interpreter_path):
+        """First line of `interpreter --version`, or None if it does not run"""
+        try:
+            result = subprocess.run([interpreter_path, '--version'], 
+                                  capture_output=True, text=True, timeout=5)
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip().split('\n')[0]
 
     def _compile_c_implementation(self):
         """Compile C implementation if needed"""
@@ -488,15 +700,10 @@ class PortableUnifiedRunner:
             return False
             
         try:
-            cmd = self.implementations['c']['compile_cmd']
-            self._log(f"Compiling C implementation: {cmd}")
-            
-            # Modify command to use found source file
-            cmd_parts = cmd.split()
-            for i, part in enumerate(cmd_parts):
-                if part == 'vmtest.c':
-                    cmd_parts[i] = str(source_file)
-                    break
+            # Substitute the found source file into the prebuilt argv
+            cmd_parts = [str(source_file) if part is _SRC_PLACEHOLDER else part
+                         for part in self.implementations['c']['compile_cmd']]
+            self._log(f"Compiling C implementation: {subprocess.list2cmdline(cmd_parts)}")
             
             result = subprocess.run(cmd_parts, capture_output=True, text=True, timeout=30)
             
@@ -537,15 +744,15 @@ class PortableUnifiedRunner:
                 if len(parts) == 3:
                     node_binary = parts[1]
                     js_file = parts[2]
-                    cmd = f'"{node_binary}" "{js_file}" {self.iterations}'
+                    cmd = [node_binary, js_file, str(self.iterations)]
                     self._log(f"DEBUG: Constructed Node.js command: {cmd}")
                 else:
                     self._log(f"Invalid Node.js special format: {portable_path}", 'ERROR')
                     return None
             else:
-                cmd = f'"{portable_path}"'
+                cmd = [portable_path]
                 if lang != 'c':  # C executable doesn't need iterations as parameter
-                    cmd += f' {self.iterations}'
+                    cmd.append(str(self.iterations))
         else:
             # Fallback handling for system implementations
             if lang == 'c':
@@ -557,239 +764,230 @@ class PortableUnifiedRunner:
         
         # Execute the implementation
         try:
-            self._log(f"Running {lang.upper()}: {cmd}")
+            self._log(f"Running {lang.upper()}: {subprocess.list2cmdline(cmd)}")
             start_time = time.time()
-
-            result = subprocess.run(
-                cmd, 
-                shell=True,
-                capture_output=True, 
-                text=True, 
-                timeout=300,  # 5 minute timeout
+            
+            # argv list, no shell: one process per benchmark and no quoting issues
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
                 cwd=str(self.bundle_dir) if self.portable_mode else None
             )
+            
+            # Drain stderr on the side so a chatty child cannot block on a full pipe
+            stderr_chunks = []
+            stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+            stderr_reader.start()
+            
+            timed_out = threading.Event()
+            def _expire():
+                timed_out.set()
+                proc.kill()
+            timer = threading.Timer(300, _expire)  # 5 minute timeout
+            timer.start()
+            
+            # Capture only the JSON document, decoding it as soon as a line can close it
+            json_lines = []
+            output_tail = deque(maxlen=50)
+            data = None
+            try:
+                for line in proc.stdout:
+                    if not json_lines and not line.lstrip().startswith('{'):
+                        output_tail.append(line)
+                        continue
+                    json_lines.append(line)
+                    if line.rstrip().endswith('}'):
+                        try:
+                            data, _ = _JSON_DECODER.raw_decode(''.join(json_lines).lstrip())
+                            break
+                        except json.JSONDecodeError:
+                            continue
+                # Discard anything printed after the JSON document
+                for line in proc.stdout:
+                    output_tail.append(line)
+                proc.wait()
+            finally:
+                timer.cancel()
+                stderr_reader.join()
+                proc.stdout.close()
+                proc.stderr.close()
             execution_time = time.time() - start_time
+            stderr = ''.join(stderr_chunks)
+            
+            if timed_out.is_set():
+                self._log(f"{lang.upper()} execution timed out", 'ERROR')
+                return None
             
             # DEBUG: Add more verbose error reporting for Node.js
-            if lang == 'nodejs' and result.returncode != 0:
-                self._log(f"DEBUG: Node.js exit code: {result.returncode}")
-                self._log(f"DEBUG: Node.js stdout: {result.stdout}")
-                self._log(f"DEBUG: Node.js stderr: {result.stderr}")
+            if lang == 'nodejs' and proc.returncode != 0:
+                self._log(f"DEBUG: Node.js exit code: {proc.returncode}")
+                self._log(f"DEBUG: Node.js stdout: {''.join(output_tail)}")
+                self._log(f"DEBUG: Node.js stderr: {stderr}")
                 self._log(f"DEBUG: Working directory: {self.bundle_dir if self.portable_mode else os.getcwd()}")
             
-            if result.returncode == 0:
+            if proc.returncode == 0:
                 try:
-                    print("JSON searching...")
-                    # Find JSON in output
-                    output_lines = result.stdout.strip().split('\n')
-                    json_start = -1
-                    json_end = -1
-                    
-                    for i, line in enumerate(output_lines):
-                        if line.strip().startswith('{'):
-                            json_start = i
-                            break
-                    
-                    if json_start >= 0:
-                        for i in range(len(output_lines) - 1, json_start - 1, -1):
-                            if output_lines[i].strip().endswith('}'):
-                                json_end = i
-                                break
-                    
-                    if json_start >= 0 and json_end >= 0:
-                        json_text = '\n'.join(output_lines[json_start:json_end + 1])
-                        data = json.loads(json_text)
-                        
-                        self._log(f"{lang.upper()}: Completed in {execution_time:.2f}s")
+                    if data is not None:
                         # Add metadata
                         data['execution_time_seconds'] = execution_time
                         data['language'] = lang
 
                         self._log(f"{lang.upper()}: Completed in {execution_time:.2f}s")
                         return data
-                    else:
-                        self._log(f"{lang.upper()}: No JSON found in output", 'ERROR')
-                        return None
+                    elif json_lines:
+                        # Output ended without completing the document; report why
+                        _JSON_DECODER.raw_decode(''.join(json_lines).lstrip())
+                    self._log(f"{lang.upper()}: No JSON found in output", 'ERROR')
+                    return None
                 except json.JSONDecodeError as e:
                     self._log(f"{lang.upper()}: Failed to parse JSON output: {e}", 'ERROR')
                     if self.verbose:
-                        self._log(f"Raw output: {result.stdout[:500]}...")
+                        self._log(f"Raw output: {''.join(json_lines)[:500]}...")
                     return None
             else:
-                self._log(f"{lang.upper()} execution failed: {result.stderr}", 'ERROR')
+                self._log(f"{lang.upper()} execution failed: {stderr}", 'ERROR')
                 return None
                 
-        except subprocess.TimeoutExpired:
-            self._log(f"{lang.upper()} execution timed out", 'ERROR')
-            return None
         except Exception as e:
             self._log(f"{lang.upper()} execution error: {e}", 'ERROR')
             return None
     def _create_csv_report(self):
-        """Create CSV report from results"""
+        """Create CSV report from results, UTF-8 encoded once for both disk and upload"""
         if not self.results:
-            return ""
+            return b""
         
         import csv
         import io
         
-        # Define all possible measurement keys
-        measurement_keys = [
-            'TIMING_BASIC_MEAN', 'TIMING_BASIC_VARIANCE', 'TIMING_BASIC_CV',
-            'TIMING_BASIC_SKEWNESS', 'TIMING_BASIC_KURTOSIS',
-            'TIMING_CONSECUTIVE_MEAN', 'TIMING_CONSECUTIVE_VARIANCE', 'TIMING_CONSECUTIVE_CV',
-            'TIMING_CONSECUTIVE_SKEWNESS', 'TIMING_CONSECUTIVE_KURTOSIS',
-            'SCHEDULING_THREAD_MEAN', 'SCHEDULING_THREAD_VARIANCE', 'SCHEDULING_THREAD_CV',
-            'SCHEDULING_THREAD_SKEWNESS', 'SCHEDULING_THREAD_KURTOSIS',
-            'PHYSICAL_MACHINE_INDEX',
-            'SCHEDULING_MULTIPROC_MEAN', 'SCHEDULING_MULTIPROC_VARIANCE', 'SCHEDULING_MULTIPROC_CV',
-            'SCHEDULING_MULTIPROC_SKEWNESS', 'SCHEDULING_MULTIPROC_KURTOSIS',
-            'MULTIPROC_PHYSICAL_MACHINE_INDEX',
-            'CACHE_ACCESS_RATIO', 'CACHE_MISS_RATIO',
-            'MEMORY_ADDRESS_ENTROPY',
-            'OVERALL_TIMING_CV', 'OVERALL_SCHEDULING_CV'
-        ]
-        
         # Create CSV in memory
         output = io.StringIO()
         writer = csv.writer(output)
         
         # Header row: Measurement, Language1, Language2, ...
         languages = sorted(self.results.keys())
-        header = ['Measurement'] + languages
-        writer.writerow(header)
-        scientific_notation_keys = {
-            'PHYSICAL_MACHINE_INDEX',
-            'MULTIPROC_PHYSICAL_MACHINE_INDEX'
-        }
-        # Data rows: one per measurement
-        for measurement in measurement_keys:
+        writer.writerow(['Measurement'] + languages)
+        
+        # Data rows: one per measurement, formatter chosen once per row
+        lang_measurements = [self.results[lang].get('measurements') for lang in languages]
+        for measurement in self.measurement_keys:
+            fmt = self._FMT[measurement]
             row = [measurement]
-            for lang in languages:
-                if lang in self.results and 'measurements' in self.results[lang]:
-                    value = self.results[lang]['measurements'].get(measurement, 'N/A')
-                    # Format numbers to 6 decimal places if they're floats
-                    if isinstance(value, (int, float)) and value != 'N/A':
-                        if measurement in scientific_notation_keys:
-                            # Use scientific notation for machine indexes
-                            row.append(f"{value:.6e}")
-                        else:
-                            # Use regular decimal notation for other measurements
-                            row.append(f"{value:.6f}")
-                    else:
-                        row.append(str(value))
-                else:
+            for measurements in lang_measurements:
+                if measurements is None:
                     row.append('N/A')
+                    continue
+                value = measurements.get(measurement, 'N/A')
+                row.append(fmt(value) if isinstance(value, (int, float)) else str(value))
             writer.writerow(row)
         
-        return output.getvalue()
+        return output.getvalue().encode('utf-8')
+
+    def _summary_ctx(self, system_info):
+        """Pull the host identity fields used by the summaries out of system_info once"""
+        basic = system_info.get('basic_info') or _EMPTY
+        network = system_info.get('network_info') or _EMPTY
+        hardware = system_info.get('hardware_info') or _EMPTY
+        return _SummaryCtx(
+            machine_name=basic.get('machine_name', 'Unknown'),
+            platform=basic.get('platform', 'Unknown'),
+            machine=basic.get('machine', 'Unknown'),
+            ips=network.get('ip_addresses') or [],
+            mac=network.get('mac_address'),
+            machine_id=hardware.get('machine_id'),
+            cpu_count=hardware.get('cpu_count', 'Unknown')
+        )
 
-    def _post_to_discord(self, csv_content, webhook_url, system_info):
+    def _post_to_discord(self, csv_content, webhook_url, system_info, ctx, now):
         """Post CSV and system info to Discord webhook"""
-        import requests
-        
         if not webhook_url:
             self._log("No Discord webhook URL provided - skipping Discord post")
             return
         
         try:
-            # Extract key system information
-            basic = system_info.get('basic_info', {})
-            network = system_info.get('network_info', {})
-            hardware = system_info.get('hardware_info', {})
-            
             # Create comprehensive summary message
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
             languages = list(self.results.keys())
             
             # Determine VM detection result
-            vm_detections = {}
-            for lang, result in self.results.items():
-                if result and 'vm_indicators' in result:
-                    vm_detections[lang] = result['vm_indicators'].get('likely_vm', False)
-            
-            vm_votes = list(vm_detections.values()) if vm_detections else []
-            vm_consensus = sum(vm_votes) / len(vm_votes) if vm_votes else 0
-            vm_detected = vm_consensus > 0.5
+            vm_detections = self._agg['vm_detections']
+            vm_consensus = self._agg['vm_consensus']
+            vm_detected = self._agg['likely_vm']
             
             # Build summary message
-            summary = f"**🖥️ VMTest Results - {timestamp}**\n\n"
+            parts = [f"**🖥️ VMTest Results - {timestamp}**\n\n"]
             
             # System identification
-            summary += f"**System Information:**\n"
-            summary += f"• Machine: `{basic.get('machine_name', 'Unknown')}`\n"
-            summary += f"• Platform: `{basic.get('platform', 'Unknown')}`\n"
-            summary += f"• Architecture: `{basic.get('machine', 'Unknown')}`\n"
+            parts.append("**System Information:**\n")
+            parts.append(f"• Machine: `{ctx.machine_name}`\n")
+            parts.append(f"• Platform: `{ctx.platform}`\n")
+            parts.append(f"• Architecture: `{ctx.machine}`\n")
             
             # FIXED: Include ALL IP addresses
-            ip_addresses = network.get('ip_addresses', [])
+            ip_addresses = ctx.ips
             if ip_addresses:
                 if len(ip_addresses) == 1:
-                    summary += f"• IP: `{ip_addresses[0]}`\n"
+                    parts.append(f"• IP: `{ip_addresses[0]}`\n")
                 else:
-                    summary += f"• Primary IP: `{ip_addresses[0]}`\n"
-                    summary += f"• All IPs: `{', '.join(ip_addresses[:15])}`"  # Limit to first 5 to avoid message length issues
+                    parts.append(f"• Primary IP: `{ip_addresses[0]}`\n")
+                    parts.append(f"• All IPs: `{', '.join(islice(ip_addresses, 15))}`")  # Limit to first 5 to avoid message length issues
                     if len(ip_addresses) > 15:
-                        summary += f" (+{len(ip_addresses)-15} more)"
-                    summary += "\n"
+                        parts.append(f" (+{len(ip_addresses)-15} more)")
+                    parts.append("\n")
             
-            if hardware.get('machine_id'):
-                summary += f"• Machine ID: `{hardware['machine_id'][:100]}...`\n"
-            summary += f"• CPU Cores: `{hardware.get('cpu_count', 'Unknown')}`\n"
+            if ctx.machine_id:
+                parts.append(f"• Machine ID: `{ctx.machine_id[:100]}...`\n")
+            parts.append(f"• CPU Cores: `{ctx.cpu_count}`\n")
             
             # Add MAC address if available
-            if network.get('mac_address'):
-                summary += f"• MAC: `{network['mac_address']}`\n"
+            if ctx.mac:
+                parts.append(f"• MAC: `{ctx.mac}`\n")
             
-            summary += "\n"
+            parts.append("\n")
             
             # Test results
-            summary += f"**Test Results:**\n"
-            summary += f"• Languages tested: `{', '.join(languages)}`\n"
-            summary += f"• Iterations: `{self.iterations}`\n"
-            summary += f"• Portable mode: `{self.portable_mode}`\n\n"
+            parts.append("**Test Results:**\n")
+            parts.append(f"• Languages tested: `{', '.join(languages)}`\n")
+            parts.append(f"• Iterations: `{self.iterations}`\n")
+            parts.append(f"• Portable mode: `{self.portable_mode}`\n\n")
             
             # VM Detection result
             if vm_detected:
-                summary += f"🚨 **VM DETECTED** (Confidence: {vm_consensus:.1%})\n"
+                parts.append(f"🚨 **VM DETECTED** (Confidence: {vm_consensus:.1%})\n")
             else:
-                summary += f"✅ **PHYSICAL MACHINE** (Confidence: {(1-vm_consensus):.1%})\n"
+                parts.append(f"✅ **PHYSICAL MACHINE** (Confidence: {(1-vm_consensus):.1%})\n")
             
             # Per-language results
             if vm_detections:
-                summary += f"\n**Detection by Language:**\n"
+                parts.append("\n**Detection by Language:**\n")
                 for lang, detected in vm_detections.items():
-                    status = "🚨 VM" if detected else "✅ Physical"
-                    summary += f"• {lang.upper()}: {status}\n"
+                    parts.append(f"• {lang.upper()}: {_VM_STATUS_SHORT[bool(detected)]}\n")
             
             # Execution times
-            exec_times = []
-            for lang, result in self.results.items():
-                if result and 'execution_time_seconds' in result:
-                    time_sec = result['execution_time_seconds']
-                    exec_times.append(f"{lang}: {time_sec:.2f}s")
-            
+            exec_times = [f"{lang}: {time_sec:.2f}s" for lang, time_sec in self._agg['exec_times_s'].items()]
             if exec_times:
-                summary += f"\n**Execution Times:** {', '.join(exec_times)}\n"
+                parts.append(f"\n**Execution Times:** {', '.join(exec_times)}\n")
             
-            summary += f"\n📊 **CSV Report attached with {len(self.measurement_keys)} measurements**"
+            parts.append(f"\n📊 **CSV Report attached with {len(self.measurement_keys)} measurements**")
+            summary = ''.join(parts)
             
             # Prepare Discord payload
-            csv_filename = f"vmtest_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            csv_filename = self._csv_filename(now)
             
+            # Summary, CSV and full system info go out in a single multipart request
             files = {
-                'file': (csv_filename, csv_content, 'text/csv')
-            }
-            
-            data = {
-                'content': summary
+                'payload_json': (None, json.dumps({'content': summary}), 'application/json'),
+                'files[0]': self._webhook_attachment(csv_filename, csv_content, 'text/csv'),
+                'files[1]': self._webhook_attachment('system_info.json',
+                                                     json.dumps(system_info, indent=2, default=str).encode('utf-8'),
+                                                     'application/json')
             }
             
             # Post to Discord
             self._log("Posting results to Discord...")
-            response = requests.post(
+            response = self._http_session().post(
                 webhook_url,
-                data=data,
                 files=files,
                 timeout=30
             )
@@ -802,6 +1000,69 @@ class PortableUnifiedRunner:
         except Exception as e:
             self._log(f"❌ Discord post error: {e}", 'ERROR')
 
+    def _http_session(self):
+        """Pooled session shared by webhook posts; requests is only imported when something is sent"""
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            # A webhook POST is not idempotent: only retry when the message was
+            # certainly not accepted (connect failures, 429 honouring Retry-After)
+            class PostRetry(Retry):
+                RETRY_AFTER_STATUS_CODES = frozenset({429})
+            
+            self._http = requests.Session()
+            self._http.mount('https://', HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=32,
+                max_retries=PostRetry(total=3, connect=3, read=0, other=0, backoff_factor=0.3,
+                                      status_forcelist=[429], respect_retry_after_header=True,
+                                      allowed_methods=frozenset({'POST'}))
+            ))
+        return self._http
+
+    def _csv_filename(self, now):
+        """Name of the CSV report, shared by the Discord upload and the local copy"""
+        return f"vmtest_results_{now.strftime('%Y%m%d_%H%M%S')}.csv"
+
+    def _webhook_attachment(self, filename, data, content_type):
+        """Multipart file tuple for a webhook post, gzipped when the payload is large"""
+        if len(data) < self._GZIP_MIN_BYTES:
+            return (filename, data, content_type)
+        return (filename + '.gz', gzip.compress(data, compresslevel=6), 'application/gzip')
+
+    def _compute_aggregates(self):
+        """Collect per-language detections and timings from self.results in one pass"""
+        vm_detections = {}
+        exec_names = []
+        exec_ms = array('d')
+        exec_times_s = {}
+        vm_yes = 0
+        for lang, result in self.results.items():
+            if not result:
+                continue
+            if 'vm_indicators' in result:
+                detected = result['vm_indicators'].get('likely_vm', False)
+                vm_detections[lang] = detected
+                vm_yes += bool(detected)
+            if 'execution_time_ms' in result:
+                exec_names.append(lang)
+                exec_ms.append(result['execution_time_ms'])
+            if 'execution_time_seconds' in result:
+                exec_times_s[lang] = result['execution_time_seconds']
+        
+        vm_total = len(vm_detections)
+        self._agg = {
+            'vm_detections': vm_detections,
+            'exec_names': exec_names,
+            'exec_ms': exec_ms,
+            'exec_times_s': exec_times_s,
+            'vm_consensus': vm_yes / vm_total if vm_total else 0,
+            # Strict majority of the implementations that reported a verdict
+            'likely_vm': vm_yes * 2 > vm_total
+        }
+
     def _analyze_cross_language_results(self):
         """Perform cross-language analysis of results"""
         if not self.results:
@@ -815,42 +1076,38 @@ class PortableUnifiedRunner:
             'consensus': {}
         }
         
-        # Extract VM detection results
-        vm_detections = {}
-        for lang, result in self.results.items():
-            if result and 'vm_indicators' in result:
-                vm_detections[lang] = result['vm_indicators'].get('likely_vm', False)
-                
         # Check consensus on VM detection
+        vm_detections = self._agg['vm_detections']
         if vm_detections:
-            vm_votes = list(vm_detections.values())
-            vm_consensus = sum(vm_votes) / len(vm_votes)
+            vm_consensus = self._agg['vm_consensus']
             analysis['consensus']['vm_detection_rate'] = vm_consensus
-            analysis['consensus']['likely_vm'] = vm_consensus > 0.5
+            analysis['consensus']['likely_vm'] = self._agg['likely_vm']
             
-            # Check if all implementations agree
-            analysis['consistent_vm_detection'] = len(set(vm_votes)) <= 1
+            # All implementations agree exactly when the vote share is 0 or 1
+            analysis['consistent_vm_detection'] = vm_consensus in (0, 1)
             analysis['vm_detection_by_language'] = vm_detections
             
         return analysis
 
-    def _generate_report(self, analysis, system_info):
+    def _generate_report(self, analysis, system_info, now):
         """Generate comprehensive report"""
+        consensus = analysis.get('consensus') or _EMPTY
         return {
             'unified_vmtest_report': {
                 'metadata': {
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': now.isoformat(),
                     'runner_version': '2.0-portable',
                     'platform': platform.platform(),
                     'portable_mode': self.portable_mode,
                     'iterations': self.iterations
                 },
                 'system_identification': system_info,
-                'execution_log': getattr(self, 'execution_log', []),
+                # One pre-formatted string encodes far faster than a list of small dicts
+                'execution_log': ''.join(self.execution_log),
                 'summary': {
                     'total_languages_tested': len(self.results),
-                    'consensus_vm_detection': analysis.get('consensus', {}).get('likely_vm', False),
-                    'detection_confidence': analysis.get('consensus', {}).get('vm_detection_rate', 0),
+                    'consensus_vm_detection': consensus.get('likely_vm', False),
+                    'detection_confidence': consensus.get('vm_detection_rate', 0),
                     'measurements_consistent': analysis.get('consistent_vm_detection', False),
                     'fastest_implementation': self._get_fastest_implementation(),
                     'portable_executables_used': sum(1 for lang, result in self.results.items() 
@@ -866,131 +1123,137 @@ class PortableUnifiedRunner:
         if not self.results:
             return None
             
-        execution_times = {}
-        for lang, result in self.results.items():
-            if result and 'execution_time_ms' in result:
-                execution_times[lang] = result['execution_time_ms']
-                
-        if execution_times:
-            return min(execution_times, key=execution_times.get)
+        exec_ms = self._agg['exec_ms']
+        if exec_ms:
+            return self._agg['exec_names'][min(range(len(exec_ms)), key=exec_ms.__getitem__)]
         return None
 
     def _save_results(self, report):
         """Save results to files"""
-        os.makedirs(self.output_dir, exist_ok=True)
+        # Serialize each result once; the same text goes to its own file and into the main report
+        blobs = {lang: self._dump_json(result) for lang, result in self.results.items() if result}
         
         # Save main report
-        report_file = os.path.join(self.output_dir, 'unified_vmtest_report.json')
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        report_file = f"{self._out_prefix}unified_vmtest_report.json"
+        if self.verbose:
+            text = self._dump_json(report)
+        else:
+            inner = dict(report['unified_vmtest_report'], individual_results=self._RESULTS_MARKER)
+            results_text = b'{' + b','.join(self._dump_json(lang) + b':' + blob for lang, blob in blobs.items()) + b'}'
+            text = self._dump_json({'unified_vmtest_report': inner}).replace(
+                self._dump_json(self._RESULTS_MARKER), results_text, 1)
+        with open(report_file, 'wb') as f:
+            f.write(text)
         self._log(f"Report saved to: {report_file}")
         
         # Save individual results
-        for lang, result in self.results.items():
-            if result:
-                individual_file = os.path.join(self.output_dir, f'vmtest_{lang}_result.json')
-                with open(individual_file, 'w') as f:
-                    json.dump(result, f, indent=2)
+        prefix = self._out_prefix
+        for lang, blob in blobs.items():
+            individual_file = f'{prefix}vmtest_{lang}_result.json'
+            with open(individual_file, 'wb') as f:
+                f.write(blob)
                     
-        # Create summary text file
-        summary_file = os.path.join(self.output_dir, 'summary.txt')
-        with open(summary_file, 'w') as f:
-            summary = report['unified_vmtest_report']['summary']
-            analysis = report['unified_vmtest_report']['cross_language_analysis']
-            
-            f.write("VMtest Portable Unified Results Summary\n")
-            f.write("=" * 45 + "\n\n")
-            
-            f.write(f"Runner mode: {'Portable executable' if self.portable_mode else 'Source mode'}\n")
-            f.write(f"Languages tested: {summary['total_languages_tested']}\n")
-            f.write(f"Portable executables used: {summary['portable_executables_used']}\n")
-            f.write(f"Consensus VM detection: {summary['consensus_vm_detection']}\n")
-            f.write(f"Detection confidence: {summary['detection_confidence']:.1%}\n")
-            f.write(f"Measurements consistent: {summary['measurements_consistent']}\n")
+        # Create summary text file, assembled first and written in one call
+        summary = report['unified_vmtest_report']['summary']
+        parts = [
+            "VMtest Portable Unified Results Summary\n",
+            "=" * 45 + "\n\n",
+            f"Runner mode: {'Portable executable' if self.portable_mode else 'Source mode'}\n",
+            f"Languages tested: {summary['total_languages_tested']}\n",
+            f"Portable executables used: {summary['portable_executables_used']}\n",
+            f"Consensus VM detection: {summary['consensus_vm_detection']}\n",
+            f"Detection confidence: {summary['detection_confidence']:.1%}\n",
+            f"Measurements consistent: {summary['measurements_consistent']}\n",
+        ]
+        
+        if summary['fastest_implementation']:
+            parts.append(f"Fastest implementation: {summary['fastest_implementation']}\n")
             
-            if summary['fastest_implementation']:
-                f.write(f"Fastest implementation: {summary['fastest_implementation']}\n")
-                
-            f.write(f"\nDetection by language:\n")
-            for lang, detected in analysis.get('vm_detection_by_language', {}).items():
-                f.write(f"  {lang}: {'VM detected' if detected else 'Physical machine'}\n")
+        parts.append("\nDetection by language:\n")
+        for lang, detected in self._agg['vm_detections'].items():
+            parts.append(f"  {lang}: {_VM_STATUS_TEXT[bool(detected)]}\n")
+        
+        with open(f"{prefix}summary.txt", 'w') as f:
+            f.write(''.join(parts))
                 
-    def _print_comprehensive_summary(self, report):
+    def _dump_json(self, obj):
+        """UTF-8 JSON bytes: compact by default, indented only in verbose mode"""
+        if orjson is not None:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if self.verbose else 0)
+        if self.verbose:
+            return json.dumps(obj, indent=2, default=str).encode('utf-8')
+        return json.dumps(obj, separators=(',', ':'), default=str).encode('utf-8')
+
+    def _print_comprehensive_summary(self, report, ctx):
         """Print detailed summary to console"""
         summary = report['unified_vmtest_report']['summary']
         analysis = report['unified_vmtest_report']['cross_language_analysis']
-        system_info = report['unified_vmtest_report']['system_identification']
         
-        self._log("\n" + "=" * 80)
-        self._log("🎯 FINAL VMTEST ANALYSIS RESULTS")
-        self._log("=" * 80)
+        lines = ["\n" + "=" * 80, "🎯 FINAL VMTEST ANALYSIS RESULTS", "=" * 80]
         
         # System summary
-        basic = system_info.get('basic_info', {})
-        network = system_info.get('network_info', {})
-        self._log(f"🖥️  Machine: {basic.get('machine_name', 'Unknown')} ({basic.get('platform', 'Unknown')})")
-        if network.get('ip_addresses'):
-            self._log(f"🌐 IP Address: {network['ip_addresses'][0] if network['ip_addresses'] else 'Unknown'}")
+        lines.append(f"🖥️  Machine: {ctx.machine_name} ({ctx.platform})")
+        if ctx.ips:
+            lines.append(f"🌐 IP Address: {ctx.ips[0]}")
         
         # Test results summary
-        self._log(f"\n📊 Test Results:")
-        self._log(f"   Languages tested: {summary['total_languages_tested']}")
-        self._log(f"   Portable executables used: {summary['portable_executables_used']}")
-        self._log(f"   Fastest implementation: {summary.get('fastest_implementation', 'Unknown')}")
+        lines.append(f"\n📊 Test Results:")
+        lines.append(f"   Languages tested: {summary['total_languages_tested']}")
+        lines.append(f"   Portable executables used: {summary['portable_executables_used']}")
+        lines.append(f"   Fastest implementation: {summary.get('fastest_implementation', 'Unknown')}")
         
         # VM Detection result
         vm_detected = summary['consensus_vm_detection']
         confidence = summary['detection_confidence']
         
-        self._log(f"\n🔍 VM Detection Analysis:")
+        lines.append(f"\n🔍 VM Detection Analysis:")
         if vm_detected:
-            self._log(f"   🚨 VIRTUAL MACHINE DETECTED")
-            self._log(f"   📈 Confidence: {confidence:.1%}")
+            lines.append(f"   🚨 VIRTUAL MACHINE DETECTED")
+            lines.append(f"   📈 Confidence: {confidence:.1%}")
         else:
-            self._log(f"   ✅ PHYSICAL MACHINE (No VM detected)")
-            self._log(f"   📈 Confidence: {(1-confidence):.1%}")
+            lines.append(f"   ✅ PHYSICAL MACHINE (No VM detected)")
+            lines.append(f"   📈 Confidence: {(1-confidence):.1%}")
         
-        self._log(f"   🎯 Cross-language consistency: {'Yes' if summary['measurements_consistent'] else 'No'}")
+        lines.append(f"   🎯 Cross-language consistency: {'Yes' if summary['measurements_consistent'] else 'No'}")
         
         # Per-language breakdown
-        vm_detections = analysis.get('vm_detection_by_language', {})
+        vm_detections = self._agg['vm_detections']
         if vm_detections:
-            self._log(f"\n🔬 Detection by Language:")
+            lines.append(f"\n🔬 Detection by Language:")
             for lang, detected in vm_detections.items():
-                status = "VM DETECTED" if detected else "Physical"
-                self._log(f"   • {lang.upper()}: {status}")
+                lines.append(f"   • {lang.upper()}: {_VM_STATUS_LONG[bool(detected)]}")
         
         # Performance summary
-        execution_times = {}
-        for lang, result in self.results.items():
-            if result and 'execution_time_ms' in result:
-                execution_times[lang] = result['execution_time_ms']
-        
-        if execution_times:
-            self._log(f"\n⚡ Performance Summary:")
-            sorted_times = sorted(execution_times.items(), key=lambda x: x[1])
-            for lang, time_ms in sorted_times:
-                self._log(f"   • {lang.upper()}: {time_ms:.1f}ms")
+        exec_names = self._agg['exec_names']
+        exec_ms = self._agg['exec_ms']
+        if exec_ms:
+            lines.append(f"\n⚡ Performance Summary:")
+            for i in sorted(range(len(exec_ms)), key=exec_ms.__getitem__):
+                lines.append(f"   • {exec_names[i].upper()}: {exec_ms[i]:.1f}ms")
         
         # Key measurements consistency
         if 'measurement_consistency' in analysis:
-            self._log(f"\n📏 Key Measurements:")
+            lines.append(f"\n📏 Key Measurements:")
             consistency = analysis['measurement_consistency']
             for measurement, stats in consistency.items():
                 if 'coefficient_of_variation' in stats:
                     cv = stats['coefficient_of_variation']
                     status = "Consistent" if cv < 0.1 else "Variable" if cv < 0.3 else "Highly Variable"
-                    self._log(f"   • {measurement}: {status} (CV: {cv:.3f})")
+                    lines.append(f"   • {measurement}: {status} (CV: {cv:.3f})")
         
-        self._log("=" * 80)
-        self._log(f"📄 Complete report saved to: {self.output_dir}")
-        self._log("=" * 80)
+        lines.append("=" * 80)
+        lines.append(f"📄 Complete report saved to: {self.output_dir}")
+        lines.append("=" * 80)
+        
+        # One logger dispatch for the whole block
+        self._log("\n".join(lines))
 
     def run_all_tests(self):
         """Run VMtest across all available implementations"""
         self._log("🚀 Starting portable unified VMtest execution")
         self._log(f"Portable mode: {self.portable_mode}")
-        self._log(f"Bundle directory: {self.bundle_dir}")
+        if self.verbose:
+            self._log(f"Bundle directory: {self.bundle_dir}")
         self._log(f"Output directory: {self.output_dir}")
         self._log(f"Iterations per test: {self.iterations}")
         
@@ -1006,12 +1269,14 @@ class PortableUnifiedRunner:
             return None
         
         self._log(f"\n✅ Found {len(available_deps)} available implementations:")
-        for lang, info in available_deps.items():
-            self._log(f"  • {lang.upper()}: {info}")
+        if self.verbose:
+            for lang, info in available_deps.items():
+                self._log(f"  • {lang.upper()}: {info}")
             
-        # Run each implementation
+        # Run each implementation on its own: the benchmarks measure timing and
+        # scheduling noise, so running them side by side would measure each other
         self._log("\n🏃 Running implementations...")
-        for lang in ['c', 'python', 'nodejs', 'ruby']:
+        for lang in _LANGUAGES:
             if lang in available_deps:
                 self._log(f"\n--- Running {lang.upper()} implementation ---")
                 result = self._run_implementation(lang, available_deps)
@@ -1022,6 +1287,8 @@ class PortableUnifiedRunner:
                     self._log(f"✅ {lang.upper()} completed successfully")
                 else:
                     self._log(f"❌ {lang.upper()} failed or timed out")
+        
+        self._compute_aggregates()
                     
         if not self.results:
             self._log("No implementations completed successfully!", 'ERROR')
@@ -1035,22 +1302,25 @@ class PortableUnifiedRunner:
         
         # Generate and save report
         self._log("\n📊 Generating comprehensive report...")
-        report = self._generate_report(analysis, system_info)
+        # One timestamp for the report, the Discord message and both CSV copies
+        now = datetime.now()
+        report = self._generate_report(analysis, system_info, now)
+        ctx = self._summary_ctx(system_info)
         report_file = self._save_results(report)
         if self.webhook_url:
             self._log("Creating CSV report for Discord...")
             csv_content = self._create_csv_report()
-            if csv_content:
-                self._post_to_discord(csv_content, self.webhook_url, system_info)
             
-            # Also save CSV locally
-            csv_filename = f"vmtest_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            csv_path = os.path.join(self.output_dir, csv_filename)
-            with open(csv_path, 'w', newline='') as f:
+            # Also save CSV locally; the same bytes are uploaded below
+            csv_path = self._out_prefix + self._csv_filename(now)
+            with open(csv_path, 'wb') as f:
                 f.write(csv_content)
             self._log(f"CSV saved locally: {csv_path}")
+            
+            if csv_content:
+                self._post_to_discord(csv_content, self.webhook_url, system_info, ctx, now)
         # Print comprehensive summary to console
-        self._print_comprehensive_summary(report)
+        self._print_comprehensive_summary(report, ctx)
         
         return report_file
 
@@ -1140,9 +1410,9 @@ exe = EXE(
     name='vmtest_unified',
     debug=False,
     bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
+    # UPX would unpack the whole binary on every launch; strip symbols instead (not on Windows)
+    strip=sys.platform != 'win32',
+    upx=False,
     runtime_tmpdir=None,
     console=True,
     disable_windowed_traceback=False,